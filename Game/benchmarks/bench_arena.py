@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Arena Scaling Benchmark
+Tick time of the multiplayer Arena against snake count and board size, with
+little and with plenty of food. Per-snake cost should stay flat as snakes
+grow longer, since collisions go through the shared occupancy index.
+
+Usage: python benchmarks/bench_arena.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import DIRECTIONS
+from snake_core.arena import Arena
+
+GRID_SIZES = [100, 250, 500]
+SNAKE_COUNTS = [10, 100, 500]
+FOOD_PER_SNAKE = [1, 20]
+MAX_FOOD_SHARE = 0.05  # Skip settings where food would cover more of the board than this
+WARMUP_TICKS = 1000  # Untimed ticks first, so snakes have had time to grow
+MIN_SECONDS = 0.5
+
+
+def steer(arena: Arena, rng: random.Random):
+    """Untimed policy: keep heading unless the next cell holds a snake, then
+    take a random free turn; also turn at random one tick in ten"""
+    size = arena.grid_size
+    actions = []
+    for snake in arena.snakes:
+        if not snake.alive:
+            actions.append(None)
+            continue
+        x, y = snake.segments[0] % size, snake.segments[0] // size
+        options = [d for d in DIRECTIONS if arena.owner[(y + d[1]) % size * size + (x + d[0]) % size] <= 0]
+        if snake.direction in options and rng.random() >= 0.1:
+            actions.append(None)
+        else:
+            actions.append(rng.choice(options) if options else None)
+    return actions
+
+
+def run(grid_size: int, num_snakes: int, food_per_snake: int):
+    """Return (microseconds per tick, mean snake length)"""
+    arena = Arena(grid_size, num_snakes, num_snakes * food_per_snake, seed=0)
+    rng = random.Random(1)
+    for _ in range(WARMUP_TICKS):
+        for snake_id in arena.step(steer(arena, rng)):
+            arena.respawn(snake_id)
+    ticks = 0
+    total_length = 0
+    elapsed = 0.0
+    while elapsed < MIN_SECONDS:
+        actions = steer(arena, rng)
+        start = time.perf_counter()
+        dead = arena.step(actions)
+        elapsed += time.perf_counter() - start
+        for snake_id in dead:
+            arena.respawn(snake_id)
+        total_length += sum(len(snake) for snake in arena.snakes)
+        ticks += 1
+    return elapsed / ticks * 1e6, total_length / ticks / num_snakes
+
+
+def main():
+    print(f"{'grid':>8} {'snakes':>7} {'food':>6} {'mean len':>9} {'us/tick':>9} {'us/snake':>9}")
+    for grid_size in GRID_SIZES:
+        for num_snakes in SNAKE_COUNTS:
+            for food_per_snake in FOOD_PER_SNAKE:
+                if num_snakes * food_per_snake > MAX_FOOD_SHARE * grid_size * grid_size:
+                    continue
+                us, length = run(grid_size, num_snakes, food_per_snake)
+                print(f"{grid_size:>4}x{grid_size:<3} {num_snakes:>7} {num_snakes * food_per_snake:>6} "
+                      f"{length:>9.1f} {us:>9.1f} {us / num_snakes:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
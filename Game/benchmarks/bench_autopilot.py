@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Autopilot Benchmark
+Decision time of Autopilot.next_direction per tick (mean, p99, max) and
+the length it reaches, against grid size.
+
+Usage: python benchmarks/bench_autopilot.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import SnakeGame
+from snake_core.autopilot import Autopilot
+
+GRID_SIZES = [10, 20, 30, 100, 200]
+GAMES = 5
+MAX_STEPS = 20000
+
+
+def run(grid_size: int):
+    """Return (sorted decision times in seconds, mean final length)"""
+    times = []
+    lengths = []
+    for seed in range(GAMES):
+        game = SnakeGame(grid_size, seed=seed)
+        game.game_started = True
+        pilot = Autopilot(grid_size)
+        for _ in range(MAX_STEPS):
+            if game.game_over:
+                break
+            start = time.perf_counter()
+            direction = pilot.next_direction(game)
+            times.append(time.perf_counter() - start)
+            if direction is not None:
+                game.change_direction(direction)
+            game.move_snake()
+        lengths.append(len(game.snake))
+    times.sort()
+    return times, sum(lengths) / len(lengths)
+
+
+def main():
+    print(f"{'grid':>8} {'mean us':>9} {'p99 us':>9} {'max ms':>8} {'mean len':>9}")
+    for grid_size in GRID_SIZES:
+        times, length = run(grid_size)
+        mean = sum(times) / len(times)
+        p99 = times[int(0.99 * len(times))]
+        print(f"{grid_size:>4}x{grid_size:<3} {mean * 1e6:>9.1f} {p99 * 1e6:>9.1f} {times[-1] * 1e3:>8.2f} {length:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
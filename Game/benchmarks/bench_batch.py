@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Batch Engine Benchmark
+Board-steps per second of BatchSnakeEnv with random actions, auto-resetting
+finished boards, against batch size.
+
+Usage: python benchmarks/bench_batch.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core.batch import BatchSnakeEnv
+
+GRID_SIZE = 20
+BATCH_SIZES = [1, 64, 1024, 4096, 16384]
+MIN_SECONDS = 0.5
+
+
+def run(num_boards: int) -> float:
+    """Return board-steps per second"""
+    env = BatchSnakeEnv(num_boards, GRID_SIZE, seed=0)
+    rng = np.random.default_rng(1)
+    actions = rng.integers(-1, 4, size=(256, num_boards))
+    steps = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < MIN_SECONDS:
+        _, dones = env.step(actions[steps % len(actions)])
+        if dones.any():
+            env.reset(dones)
+        steps += 1
+    return steps * num_boards / (time.perf_counter() - start)
+
+
+def main():
+    print(f"{'boards':>7} {'board-steps/s':>15}")
+    for num_boards in BATCH_SIZES:
+        print(f"{num_boards:>7} {run(num_boards):>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
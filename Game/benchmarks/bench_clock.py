@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Frame Scheduler Benchmark
+Ticks per second actually delivered at each Game Speed setting when every
+frame also spends time rendering, for the apps' old loop (tick, render,
+sleep the full interval) and for FixedStepClock. The render time is drawn
+from a seeded distribution with occasional long stalls and the clock is
+simulated, so a run takes seconds and repeats exactly; a short real-time
+run with time.sleep checks the simulation. Also checks that the board a
+seeded game reaches does not depend on how long rendering takes.
+
+Usage: python benchmarks/bench_clock.py
+"""
+
+import os
+import random
+import sys
+import time
+from typing import Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import SnakeGame
+from snake_core.clock import FixedStepClock
+
+SPEEDS_MS = (100, 200, 500)
+SIMULATED_SECONDS = 600
+REAL_SECONDS = 3.0
+SLEEP_OVERSHOOT = 0.001  # Typical time.sleep wake-up lateness
+STALL_CHANCE = 0.02  # Frames that take STALL seconds (GC, a slow websocket write)
+STALL = 0.4
+
+
+def render_time(rng: random.Random) -> float:
+    """Seconds one frame spends after the tick: grid, markup, st.markdown, rerun"""
+    if rng.random() < STALL_CHANCE:
+        return STALL
+    return rng.uniform(0.01, 0.05)
+
+
+def naive_ticks(interval: float, seconds: float) -> int:
+    rng = random.Random(0)
+    now = ticks = 0
+    while now < seconds:
+        ticks += 1
+        now += render_time(rng) + interval + SLEEP_OVERSHOOT
+    return ticks
+
+
+def clocked_ticks(interval: float, seconds: float) -> Tuple[int, FixedStepClock]:
+    rng = random.Random(0)
+    clock = FixedStepClock(interval)
+    now = 0.0
+    ticks = 0
+    while now < seconds:
+        ticks += clock.due(now)
+        now += render_time(rng)
+        now += clock.remaining(now) + SLEEP_OVERSHOOT
+    return ticks, clock
+
+
+def real_ticks(interval: float, clocked: bool) -> int:
+    """Real-time run with a 30 ms render stand-in; returns ticks in REAL_SECONDS"""
+    clock = FixedStepClock(interval)
+    ticks = 0
+    end = time.monotonic() + REAL_SECONDS
+    while time.monotonic() < end:
+        ticks += clock.due() if clocked else 1
+        time.sleep(0.03)
+        time.sleep(clock.remaining() if clocked else interval)
+    return ticks
+
+
+def board_after(render_ms: float, ticks: int = 1000) -> bytes:
+    """Seeded game driven through the clock with a fixed render time until
+    it has run ``ticks`` ticks; the turns are keyed to the tick number"""
+    clock = FixedStepClock(0.1, max_steps=ticks)
+    game = SnakeGame(20, seed=7)
+    game.game_started = True
+    now = 0.0
+    run = 0
+    while run < ticks:
+        for _ in range(min(clock.due(now), ticks - run)):
+            game.change_direction([(1, 0), (0, 1)][run // 7 % 2])
+            game.move_snake()
+            run += 1
+        now += render_ms / 1000
+        now += clock.remaining(now)
+    return game.to_bytes()
+
+
+def main():
+    print(f"simulated {SIMULATED_SECONDS} s, render 10-50 ms with {STALL_CHANCE:.0%} of frames stalling {STALL * 1000:.0f} ms")
+    print(f"{'speed ms':>9} {'target/s':>9} {'old loop/s':>11} {'clock/s':>8} {'caught up':>10} {'dropped':>8}")
+    for speed in SPEEDS_MS:
+        interval = speed / 1000
+        naive = naive_ticks(interval, SIMULATED_SECONDS)
+        ticks, clock = clocked_ticks(interval, SIMULATED_SECONDS)
+        print(f"{speed:>9} {1 / interval:>9.2f} {naive / SIMULATED_SECONDS:>11.2f} "
+              f"{ticks / SIMULATED_SECONDS:>8.2f} {clock.caught_up:>10} {clock.missed:>8}")
+
+    print(f"\nreal time, {REAL_SECONDS:.0f} s at 100 ms with a 30 ms render:")
+    print(f"  old loop: {real_ticks(0.1, False) / REAL_SECONDS:6.2f} ticks/s")
+    print(f"  clock:    {real_ticks(0.1, True) / REAL_SECONDS:6.2f} ticks/s")
+
+    boards = {render_ms: board_after(render_ms) for render_ms in (0, 30, 90, 250)}
+    same = len(set(boards.values())) == 1
+    print(f"\nboard after 1000 ticks with 0/30/90/250 ms renders: {'identical' if same else 'DIFFERENT'}")
+
+
+if __name__ == "__main__":
+    main()
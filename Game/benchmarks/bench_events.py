@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Event Log Benchmark
+Tick cost of reporting events to an EventBus (no bus vs JSON lines vs
+binary sink), how many events per second the writer thread keeps up with,
+bytes per event on disk, and how many events a small queue drops under a
+burst.
+
+Usage: python benchmarks/bench_events.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import SnakeGame
+from snake_core.events import BinarySink, EventBus, JsonLinesSink, read_events
+
+TICKS = 200000
+BURST = 1000000
+
+
+def timed(bus) -> float:
+    """Seconds per move_snake tick, with turns, food and restarts"""
+    game = SnakeGame(30, seed=0, events=bus)
+    game.game_started = True
+    start = time.perf_counter()
+    for i in range(TICKS):
+        if game.game_over:
+            game.reset_game()
+            game.game_started = True
+        game.change_direction([(1, 0), (0, 1)][i // 7 % 2])
+        game.move_snake()
+    return (time.perf_counter() - start) / TICKS
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        bare = timed(None)
+        print(f"{'sink':>8} {'us/tick':>9} {'overhead':>9} {'events':>9} {'events/s':>10} "
+              f"{'bytes/ev':>9} {'dropped':>8}")
+        print(f"{'none':>8} {bare * 1e6:>9.2f} {'':>9} {'':>9} {'':>10} {'':>9} {'':>8}")
+        for name, sink_class in [("jsonl", JsonLinesSink), ("binary", BinarySink)]:
+            path = os.path.join(tmp, f"events.{name}")
+            bus = EventBus([sink_class(path)])
+            per_tick = timed(bus)
+            start = time.perf_counter()
+            bus.close()
+            drain = time.perf_counter() - start
+            events = sum(1 for _ in read_events(path))
+            total = per_tick * TICKS + drain  # Until the last event is on disk
+            print(f"{name:>8} {per_tick * 1e6:>9.2f} {(per_tick - bare) * 1e6:>9.2f} {events:>9} "
+                  f"{events / total:>10.0f} {os.path.getsize(path) / events:>9.1f} {bus.dropped:>8}")
+
+        # Backpressure: emit far faster than any game would, into a small queue
+        bus = EventBus([BinarySink(os.path.join(tmp, "burst.bin"))], capacity=4096, batch_size=1024)
+        start = time.perf_counter()
+        for i in range(BURST):
+            bus.emit(1, i, 0, 0, 0, 3)
+        elapsed = time.perf_counter() - start
+        bus.close()
+        print(f"\nburst of {BURST} emits into a 4096-event queue: {elapsed / BURST * 1e9:.0f} ns/emit, "
+              f"{bus.dropped} dropped ({bus.dropped / BURST:.1%}), never blocked")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Food Spawn Benchmark
+Cost of SnakeGame.generate_food against board fill ratio, compared with the
+old rejection sampler (random.randint until the cell is not in the body list).
+
+Usage: python benchmarks/bench_generate_food.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import SnakeBody, SnakeGame
+
+GRID_SIZE = 100
+FILL_RATIOS = [0.10, 0.50, 0.90, 0.99, 0.999]
+MIN_SECONDS = 0.2
+
+
+def rejection_sample(game) -> tuple:
+    """The previous enhanced-version sampler, capped at grid_size² attempts"""
+    attempts = 0
+    while attempts < game.grid_size * game.grid_size:
+        food = (random.randint(0, game.grid_size - 1),
+                random.randint(0, game.grid_size - 1))
+        if food not in game.snake:
+            return food
+        attempts += 1
+    return (0, 0)
+
+
+def timed(spawn, game) -> float:
+    """Return microseconds per spawn"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        spawn(game)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SECONDS:
+            return elapsed / calls * 1e6
+
+
+def main():
+    random.seed(0)
+    cells = [(x, y) for y in range(GRID_SIZE) for x in range(GRID_SIZE)]
+    print(f"{'fill':>7} {'free':>6} {'rejection us':>13} {'engine us':>11}")
+    for ratio in FILL_RATIOS:
+        length = int(len(cells) * ratio)
+        segments = random.sample(cells, length)
+
+        game = SnakeGame(GRID_SIZE)
+        game.snake = list(segments)
+        old = timed(rejection_sample, game)
+
+        game.snake = SnakeBody(GRID_SIZE, segments)
+        new = timed(SnakeGame.generate_food, game)
+
+        free = len(cells) - length
+        print(f"{ratio:>7.1%} {free:>6} {old:>13.2f} {new:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
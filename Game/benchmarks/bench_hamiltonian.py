@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Hamiltonian Solver Benchmark
+Steps to fill the grid with HamiltonianSolver, with and without shortcuts,
+and time per decision, for every grid size the slider allows and a few
+larger ones. Also times getting the cycle: built, loaded from the disk
+cache, and from the in-memory LRU.
+
+Usage: python benchmarks/bench_hamiltonian.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import SnakeGame, hamiltonian
+from snake_core.hamiltonian import HamiltonianSolver, build_cycle, cycle_positions
+
+GRID_SIZES = list(range(10, 31)) + [40, 50]
+GAMES = 3
+
+
+def play(grid_size: int, seed: int, shortcuts: bool):
+    """Return (steps to win, seconds spent deciding)"""
+    game = SnakeGame(grid_size, seed=seed)
+    game.game_started = True
+    solver = HamiltonianSolver(grid_size, shortcuts)
+    steps = 0
+    deciding = 0.0
+    while not game.game_over:
+        start = time.perf_counter()
+        direction = solver.next_direction(game)
+        deciding += time.perf_counter() - start
+        if direction is not None:
+            game.change_direction(direction)
+        game.move_snake()
+        steps += 1
+    assert len(game.snake) == grid_size * grid_size, f"lost on {grid_size}x{grid_size}"
+    return steps, deciding
+
+
+def cycle_timings():
+    print(f"{'grid':>8} {'build ms':>9} {'disk ms':>8} {'lru us':>7}")
+    for grid_size in (30, 100, 200, 500):
+        start = time.perf_counter()
+        build_cycle(grid_size)
+        built = time.perf_counter() - start
+        cycle_positions(grid_size)  # Writes the cache file
+        cycle_positions.cache_clear()
+        start = time.perf_counter()
+        cycle_positions(grid_size)
+        loaded = time.perf_counter() - start
+        start = time.perf_counter()
+        cycle_positions(grid_size)
+        cached = time.perf_counter() - start
+        print(f"{grid_size:>4}x{grid_size:<3} {built * 1e3:>9.2f} {loaded * 1e3:>8.2f} {cached * 1e6:>7.2f}")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        hamiltonian.CACHE_DIR = directory
+        cycle_timings()
+    print()
+    print(f"{'grid':>8} {'steps':>10} {'cycle only':>11} {'saved':>6} {'us/decision':>12}")
+    for grid_size in GRID_SIZES:
+        results = [play(grid_size, seed, True) for seed in range(GAMES)]
+        steps = sum(s for s, _ in results) / GAMES
+        per_decision = sum(d for _, d in results) / sum(s for s, _ in results)
+        baseline, _ = play(grid_size, 0, False)
+        print(f"{grid_size:>4}x{grid_size:<3} {steps:>10,.0f} {baseline:>11,} {1 - steps / baseline:>6.0%} "
+              f"{per_decision * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
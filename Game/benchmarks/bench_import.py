@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Import Cost Benchmark
+Time to import the engine package, the thin front-end modules, and the
+Streamlit UI pieces, each in a fresh interpreter so nothing is cached.
+
+Usage: python benchmarks/bench_import.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 7
+
+CASES = [
+    ("snake_core", "import snake_core"),
+    ("snake_game", "import snake_game"),
+    ("snake_game_enhanced", "import snake_game_enhanced"),
+    ("streamlit + snake_ui", "import streamlit, snake_ui.render, snake_ui.debug, snake_ui.client"),
+]
+
+
+def time_import(statement: str) -> float:
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=GAME_DIR,
+                         capture_output=True, text=True, check=True)
+    return float(out.stdout)
+
+
+def main():
+    for label, statement in CASES:
+        median = statistics.median(time_import(statement) for _ in range(RUNS))
+        print(f"{label:>22}: {median * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
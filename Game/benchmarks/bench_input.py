@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Input Queue Benchmark
+Quick U-turns (two presses between the same pair of ticks, e.g. Up then
+Left while heading right) with the queued change_direction, compared with
+the old last-click-wins version: how many end the game, how many ticks
+until each press takes effect, and what the queue costs per tick.
+
+Usage: python benchmarks/bench_input.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import DIRECTIONS, SnakeGame
+
+GRID_SIZE = 30
+U_TURNS = 2000
+LENGTH = 20
+TICKS = 200000
+
+
+class LastClickWinsGame(SnakeGame):
+    """The previous change_direction, kept as the comparison baseline: the
+    turn takes effect at once and is only checked against the current direction"""
+
+    def change_direction(self, new_direction):
+        if not self.game_over and self.game_started and not self.paused:
+            if new_direction[0] != -self.direction[0] or new_direction[1] != -self.direction[1]:
+                self.direction = new_direction
+
+
+def grown_game(game_class) -> SnakeGame:
+    """Started game whose snake has LENGTH segments in a straight line"""
+    game = game_class(GRID_SIZE, seed=0)
+    game.game_started = True
+    while len(game.snake) < LENGTH:
+        head = game.snake.head
+        game.board.set(game.food, 0)
+        game.food = ((head[0] + 1) % GRID_SIZE, head[1])
+        game.board.set(game.food, 3)
+        game.move_snake()
+    return game
+
+
+def u_turns(game_class):
+    """Return (games lost, mean ticks from the second press to its turn)"""
+    rng = random.Random(0)
+    lost = 0
+    delays = []
+    for _ in range(U_TURNS):
+        game = grown_game(game_class)
+        heading = game.direction
+        side = rng.choice([d for d in DIRECTIONS if d[0] != heading[0] and d[1] != heading[1]])
+        back = (-heading[0], -heading[1])
+        game.change_direction(side)
+        game.change_direction(back)
+        for tick in range(1, 4):
+            game.move_snake()
+            if game.game_over or game.direction == back:
+                break
+        if game.game_over:
+            lost += 1
+        else:
+            delays.append(tick)
+    return lost, sum(delays) / len(delays) if delays else float("nan")
+
+
+def per_tick(game_class) -> float:
+    """Microseconds per change_direction + move_snake tick, turning every 7 ticks"""
+    game = game_class(GRID_SIZE, seed=0)
+    game.game_started = True
+    start = time.perf_counter()
+    for i in range(TICKS):
+        if game.game_over:
+            game.reset_game()
+            game.game_started = True
+        game.change_direction([(1, 0), (0, 1)][i // 7 % 2])
+        game.move_snake()
+    return (time.perf_counter() - start) / TICKS * 1e6
+
+
+def main():
+    print(f"{'engine':>16} {'U-turns lost':>13} {'ticks to turn':>14} {'us/tick':>8}")
+    for name, game_class in [("last-click-wins", LastClickWinsGame), ("queued", SnakeGame)]:
+        lost, delay = u_turns(game_class)
+        print(f"{name:>16} {lost:>6}/{U_TURNS:<6} {delay:>14.2f} {per_tick(game_class):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Launch Benchmark
+Seconds from process start until the server answers its health check, for
+the in-process launcher and for a plain `streamlit run` of one variant.
+
+Usage: python benchmarks/bench_launch.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+
+from run_game import wait_until_ready
+
+PORT = 8597
+RUNS = 5
+
+COMMANDS = [
+    ("streamlit run snake_game.py", [sys.executable, "-m", "streamlit", "run", "snake_game.py",
+                                     "--server.headless", "true", "--server.port", str(PORT)]),
+    ("run_game.py --variant basic", [sys.executable, "run_game.py", "--variant", "basic",
+                                     "--headless", "--port", str(PORT)]),
+]
+
+
+def time_to_ready(command) -> float:
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=GAME_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if not wait_until_ready(PORT, 60):
+            raise RuntimeError(f"{command} did not become ready")
+        return time.perf_counter() - start
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    for label, command in COMMANDS:
+        median = statistics.median(time_to_ready(command) for _ in range(RUNS))
+        print(f"{label:>28}: {median:6.2f} s to ready")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Instrumentation Overhead Benchmark
+Cost of the per-tick TickMetrics calls made by the apps, as a share of the
+fastest frame interval the speed slider allows (100 ms) and of a bare
+move_snake + get_grid_state tick.
+
+Usage: python benchmarks/bench_metrics.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import SnakeGame
+from snake_core.metrics import TickMetrics
+
+TICKS = 100000
+
+
+def tick(game, metrics=None):
+    if metrics is None:
+        game.move_snake()
+        game.get_grid_state()
+        return
+    script_start = time.perf_counter()
+    tick_start = time.perf_counter()
+    game.move_snake()
+    tick_start = metrics.lap("move", tick_start)
+    game.get_grid_state()
+    tick_start = metrics.lap("grid", tick_start)
+    tick_start = metrics.lap("render", tick_start)
+    metrics.lap("emit", tick_start)
+    metrics.lap("script", script_start)
+    metrics.record_frame(script_start, 0.0)
+
+
+def timed(metrics) -> float:
+    game = SnakeGame(30, seed=0)
+    game.game_started = True
+    start = time.perf_counter()
+    for i in range(TICKS):
+        if game.game_over:
+            game.reset_game()
+            game.game_started = True
+        game.change_direction([(1, 0), (0, 1)][i // 7 % 2])
+        tick(game, metrics)
+    return (time.perf_counter() - start) / TICKS
+
+
+def main():
+    bare = timed(None)
+    instrumented = timed(TickMetrics(export_path=None))
+    overhead = instrumented - bare
+    print(f"bare tick:          {bare * 1e6:8.2f} us")
+    print(f"instrumented tick:  {instrumented * 1e6:8.2f} us")
+    print(f"overhead per tick:  {overhead * 1e6:8.2f} us "
+          f"({overhead / 0.1:.4%} of a 100 ms frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Move Engine Micro-benchmark
+Ticks per second of SnakeGame.move_snake against snake length, compared with
+the old list-based body (list scan for collisions, insert(0)/pop()).
+
+Usage: python benchmarks/bench_move_snake.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import SnakeBody, SnakeGame
+
+GRID_SIZE = 400
+LENGTHS = [10, 100, 1000, 10000, 100000]
+MIN_SECONDS = 0.5
+
+
+class ListSnakeGame(SnakeGame):
+    """The previous list-backed engine, kept as the comparison baseline"""
+
+    def move_snake(self):
+        if self.game_over or not self.game_started:
+            return
+        if self.inputs:
+            self.direction = self.inputs.popleft()
+        new_head = (
+            (self.snake[0][0] + self.direction[0]) % self.grid_size,
+            (self.snake[0][1] + self.direction[1]) % self.grid_size
+        )
+        if new_head in self.snake:
+            self.game_over = True
+            return
+        self.snake.insert(0, new_head)
+        if new_head == self.food:
+            self.score += 10
+            self.food = self.generate_food()
+        else:
+            self.snake.pop()
+
+
+def path_cell(step: int, grid_size: int):
+    """Cell at a given step of a tour that visits every cell of the torus.
+
+    The tour moves right grid_size - 1 times, then down once, and repeats, so
+    a snake following it never runs into itself.
+    """
+    row, col = divmod(step % (grid_size * grid_size), grid_size)
+    return ((col - row) % grid_size, row)
+
+
+def run(game_cls, length: int) -> float:
+    """Return ticks per second for a snake of the given length"""
+    game = game_cls(GRID_SIZE)
+    segments = [path_cell(-i, GRID_SIZE) for i in range(length)]
+    if game_cls is ListSnakeGame:
+        game.snake = segments
+    else:
+        game.snake = SnakeBody(GRID_SIZE, segments)
+    game.food = None  # Keep the length fixed
+    game.game_started = True
+
+    step = 0
+    elapsed = 0.0
+    while elapsed < MIN_SECONDS:
+        start = time.perf_counter()
+        for _ in range(100):
+            if step % GRID_SIZE == GRID_SIZE - 1:
+                game.change_direction((0, 1))
+            elif step % GRID_SIZE == 0:
+                game.change_direction((1, 0))
+            game.move_snake()
+            step += 1
+        elapsed += time.perf_counter() - start
+    assert not game.game_over
+    return step / elapsed
+
+
+def main():
+    print(f"{'length':>8} {'list ticks/s':>14} {'deque ticks/s':>14} {'speedup':>8}")
+    for length in LENGTHS:
+        old = run(ListSnakeGame, length)
+        new = run(SnakeGame, length)
+        print(f"{length:>8} {old:>14,.0f} {new:>14,.0f} {new / old:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Observation Benchmark
+Frames per second of ObservationEncoder for one SnakeGame (whole board and
+an egocentric window, float32 and uint8, with and without a 4-frame stack),
+against building the same planes with fresh arrays each tick, and
+board-frames per second for a BatchSnakeEnv against batch size. Also counts what a step leaves allocated:
+Python memory blocks and traced bytes after many steps into the same buffers.
+
+Usage: python benchmarks/bench_observation.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import DIRECTIONS, HEAD, SnakeGame
+from snake_core.autopilot import Autopilot
+from snake_core.batch import BatchSnakeEnv
+from snake_core.observation import FrameStack, ObservationEncoder
+
+GRID_SIZE = 20
+VIEW = 11
+STACK = 4
+BATCH_SIZES = [64, 1024, 4096]
+MIN_SECONDS = 0.5
+LEAK_STEPS = 10000
+
+
+def grown_game() -> SnakeGame:
+    game = SnakeGame(GRID_SIZE, seed=0)
+    game.game_started = True
+    pilot = Autopilot(GRID_SIZE)
+    while len(game.snake) < 40 and not game.game_over:
+        direction = pilot.next_direction(game)
+        if direction is not None:
+            game.change_direction(direction)
+        game.move_snake()
+    return game
+
+
+def allocating_planes(game) -> np.ndarray:
+    """The same whole-board float32 planes built the straightforward way, with new arrays every call"""
+    grid = game.get_grid_state()
+    n = game.grid_size
+    planes = np.zeros((8, n, n), dtype=np.float32)
+    planes[0] = (grid == 1) | (grid == HEAD)
+    planes[1] = grid == HEAD
+    if game.food is not None:
+        planes[2, game.food[1], game.food[0]] = 1
+        offset = np.arange(n)
+        dy = np.abs(offset - game.food[1])
+        dx = np.abs(offset - game.food[0])
+        planes[7] = (np.minimum(dy, n - dy)[:, None] + np.minimum(dx, n - dx)[None, :]) / (2 * (n // 2))
+    planes[3 + DIRECTIONS.index(game.direction)] = 1
+    return planes
+
+
+def rate(step) -> float:
+    """Calls per second of step()"""
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < MIN_SECONDS:
+        for _ in range(100):
+            step()
+        calls += 100
+    return calls / (time.perf_counter() - start)
+
+
+def single_cases(game):
+    yield "fresh arrays per call (baseline)", lambda: allocating_planes(game)
+    for view in (None, VIEW):
+        for dtype in (np.float32, np.uint8):
+            encoder = ObservationEncoder(GRID_SIZE, view=view, dtype=dtype)
+            out = encoder.new_buffer()
+            name = f"{'whole board' if view is None else f'{view}x{view} window'}, {np.dtype(dtype).name}"
+            yield name, lambda encoder=encoder, out=out: encoder.encode_game(game, out)
+            stack = FrameStack(encoder, STACK)
+            stacked = np.zeros(stack.frames.shape, dtype=dtype)
+            yield f"{name}, {STACK}-frame stack", lambda stack=stack, stacked=stacked: (stack.push_game(game),
+                                                                                        stack.read(stacked))
+
+
+def leftover(step) -> tuple:
+    """Python blocks and traced bytes still allocated per step after LEAK_STEPS steps"""
+    step()
+    tracemalloc.start()
+    blocks = sys.getallocatedblocks()
+    for _ in range(LEAK_STEPS):
+        step()
+    blocks = sys.getallocatedblocks() - blocks
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return blocks / LEAK_STEPS, traced / LEAK_STEPS
+
+
+def main():
+    game = grown_game()
+    print(f"one game, {GRID_SIZE}x{GRID_SIZE}, snake length {len(game.snake)}")
+    print(f"{'':<38} {'frames/s':>10} {'blocks/step':>12} {'bytes/step':>11}")
+    for name, step in single_cases(game):
+        blocks, traced = leftover(step)
+        print(f"{name:<38} {rate(step):>10,.0f} {blocks:>12.3f} {traced:>11.1f}")
+
+    print(f"\nBatchSnakeEnv, {GRID_SIZE}x{GRID_SIZE}")
+    print(f"{'boards':>7} {'whole f32 board-frames/s':>25} {f'{VIEW}x{VIEW} u8 board-frames/s':>26}")
+    for num_boards in BATCH_SIZES:
+        env = BatchSnakeEnv(num_boards, GRID_SIZE, seed=0)
+        rng = np.random.default_rng(1)
+        for _ in range(50):
+            _, dones = env.step(rng.integers(-1, 4, size=num_boards))
+            env.reset(dones)
+        rates = []
+        for view, dtype in ((None, np.float32), (VIEW, np.uint8)):
+            encoder = ObservationEncoder(GRID_SIZE, num_boards=num_boards, view=view, dtype=dtype)
+            out = encoder.new_buffer()
+            rates.append(rate(lambda: encoder.encode_batch(env, out)) * num_boards)
+        print(f"{num_boards:>7} {rates[0]:>25,.0f} {rates[1]:>26,.0f}")
+
+
+if __name__ == "__main__":
+    main()
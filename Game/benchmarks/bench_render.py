@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Frame Build Benchmark
+Time to turn the board into markup for one frame, before (nested per-cell
+loop, one st.markdown per row) and after (lookup-table render_grid_html, one
+st.markdown per frame), for every grid size the slider allows.
+
+Usage: python benchmarks/bench_render.py
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_ui.render import render_grid_html
+
+GRID_SIZES = [10, 15, 20, 25, 30]
+STYLE = "text-align: center; font-family: monospace; font-size: 1.3rem; line-height: 1.2;"
+MIN_SECONDS = 0.2
+
+
+def render_per_cell(grid):
+    """The previous frame build: returns one markup string per st.markdown call"""
+    grid_display = []
+    for row in grid:
+        row_display = []
+        for cell in row:
+            if cell == 0:
+                row_display.append("⬜")
+            elif cell == 1:
+                row_display.append("🟩")
+            elif cell == 2:
+                row_display.append("🟢")
+            elif cell == 3:
+                row_display.append("🍎")
+        grid_display.append(" ".join(row_display))
+    elements = ['<div class="game-container">']
+    for row in grid_display:
+        elements.append(f"<div style='{STYLE}'>{row}</div>")
+    elements.append('</div>')
+    return elements
+
+
+def render_lookup(grid):
+    return [render_grid_html(grid, STYLE)]
+
+
+def timed(render, grid):
+    """Return (microseconds per frame, elements per frame)"""
+    frames = 0
+    start = time.perf_counter()
+    while True:
+        elements = render(grid)
+        frames += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SECONDS:
+            return elapsed / frames * 1e6, len(elements)
+
+
+def main():
+    random.seed(0)
+    print(f"{'grid':>6} {'per-cell us':>12} {'elements':>9} {'lookup us':>10} {'elements':>9} {'speedup':>8}")
+    for grid_size in GRID_SIZES:
+        grid = np.zeros((grid_size, grid_size), dtype=np.uint8)
+        cells = grid_size * grid_size
+        grid.flat[random.sample(range(cells), cells // 3)] = 1
+        grid.flat[0] = 2
+        grid.flat[-1] = 3
+
+        old_us, old_elements = timed(render_per_cell, grid)
+        new_us, new_elements = timed(render_lookup, grid)
+        print(f"{grid_size:>3}x{grid_size:<2} {old_us:>12.1f} {old_elements:>9} "
+              f"{new_us:>10.1f} {new_elements:>9} {old_us / new_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
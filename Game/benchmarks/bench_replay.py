@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Replay Benchmark
+Records games played by the rollout baseline policy, then measures file size
+per tick, verification throughput and seek latency.
+
+Usage: python benchmarks/bench_replay.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import SnakeGame
+from snake_core.replay import ReplayReader, ReplayWriter, verify_replays
+from snake_core.rollout import random_policy
+
+GAMES = 500
+GRID_SIZE = 20
+SEEKS = 2000
+
+
+def record_games(directory: str):
+    paths = []
+    policy_rng = random.Random(0)
+    for i in range(GAMES):
+        game = SnakeGame(GRID_SIZE)
+        game.reset_game(i)
+        game.game_started = True
+        path = os.path.join(directory, f"{i}.snkr")
+        writer = ReplayWriter(path, game, i)
+        while not game.game_over:
+            direction = random_policy(game, policy_rng)
+            if direction is not None:
+                game.change_direction(direction)
+            game.move_snake()
+            writer.record(game)
+        writer.close(game)
+        paths.append(path)
+    return paths
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        paths = record_games(directory)
+        ticks = 0
+        size = 0
+        for path in paths:
+            reader = ReplayReader(path)
+            ticks += reader.ticks
+            size += os.path.getsize(path)
+            reader.close()
+        print(f"{GAMES} games, {ticks} ticks, {size} bytes ({size * 8 / ticks:.2f} bits/tick)")
+
+        for workers in (1, None):
+            start = time.perf_counter()
+            results = list(verify_replays(paths, workers=workers))
+            elapsed = time.perf_counter() - start
+            assert all(ok for _, ok in results)
+            label = "in-process" if workers == 1 else f"pool of {os.cpu_count()}"
+            print(f"verify ({label}): {GAMES / elapsed:,.0f} replays/s, {ticks / elapsed:,.0f} ticks/s")
+
+        rng = random.Random(1)
+        readers = [ReplayReader(path) for path in paths]
+        start = time.perf_counter()
+        for _ in range(SEEKS):
+            reader = rng.choice(readers)
+            reader.state_at(rng.randint(0, reader.ticks))
+        elapsed = time.perf_counter() - start
+        print(f"seek: {elapsed / SEEKS * 1e6:,.0f} us per state_at")
+        for reader in readers:
+            reader.close()
+
+
+if __name__ == "__main__":
+    main()
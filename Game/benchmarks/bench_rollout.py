@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Rollout Scaling Benchmark
+Episodes per second of run_rollouts from 1 worker up to every core, checking
+that each worker count produces exactly the same results.
+
+Usage: python benchmarks/bench_rollout.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core.rollout import run_rollouts
+
+EPISODES = 400
+SEED = 0
+
+
+def worker_counts():
+    counts = [1]
+    while counts[-1] * 2 <= os.cpu_count():
+        counts.append(counts[-1] * 2)
+    if counts[-1] != os.cpu_count():
+        counts.append(os.cpu_count())
+    return counts
+
+
+def main():
+    baseline = None
+    print(f"{'workers':>8} {'episodes/s':>11} {'speedup':>8} {'same results':>13}")
+    for workers in worker_counts():
+        start = time.perf_counter()
+        results = list(run_rollouts(EPISODES, seed=SEED, workers=workers))
+        rate = EPISODES / (time.perf_counter() - start)
+        if baseline is None:
+            baseline = (rate, results)
+        print(f"{workers:>8} {rate:>11.1f} {rate / baseline[0]:>7.2f}x {str(results == baseline[1]):>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Game Server Load Benchmark
+Starts `python -m snake_core.server` in its own process, then plays ROOMS
+rooms at 10 Hz from a local load-generator client (ROOMS spread over
+CONNECTIONS websockets, random turns, restart on game over). Reports the
+diff rate each room actually received and the server's CPU use.
+
+Usage: python benchmarks/bench_server.py [rooms] [seconds]
+"""
+
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+from websockets.asyncio.client import connect
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PORT = 8766
+ROOMS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+SECONDS = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+CONNECTIONS = 50
+SPEED = 100  # ms per tick, 10 Hz
+
+
+async def play(index: int, room_ids, stats, stop: asyncio.Event):
+    rng = random.Random(index)
+    async with connect(f"ws://localhost:{PORT}", compression=None, max_queue=None) as websocket:
+        for room_id in room_ids:
+            await websocket.send(json.dumps({"type": "join", "room": room_id, "speed": SPEED}))
+            await websocket.recv()
+            await websocket.send(json.dumps({"type": "start", "room": room_id}))
+        while not stop.is_set():
+            message = json.loads(await websocket.recv())
+            if message["type"] != "diff":
+                continue
+            stats["diffs"] += 1
+            room_id = message["room"]
+            if message["game_over"]:
+                await websocket.send(json.dumps({"type": "start", "room": room_id}))
+            elif rng.random() < 0.2:
+                await websocket.send(json.dumps({"type": "turn", "room": room_id, "direction": rng.randrange(4)}))
+
+
+def process_cpu(pid: int) -> float:
+    """User + system CPU seconds of a process (Linux /proc)"""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def load(server_pid: int, stats):
+    stop = asyncio.Event()
+    rooms = [f"room-{i}" for i in range(ROOMS)]
+    tasks = [asyncio.create_task(play(i, rooms[i::CONNECTIONS], stats, stop)) for i in range(CONNECTIONS)]
+    await asyncio.sleep(2.0)  # Joins and the first ticks
+    stats["diffs"] = 0
+    start = time.perf_counter()
+    cpu_start = process_cpu(server_pid)
+    await asyncio.sleep(SECONDS)
+    cpu = process_cpu(server_pid) - cpu_start
+    elapsed = time.perf_counter() - start
+    received = stats["diffs"]
+    stop.set()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return received, elapsed, cpu
+
+
+def main():
+    server = subprocess.Popen([sys.executable, "-m", "snake_core.server", "--port", str(PORT)], cwd=GAME_DIR)
+    try:
+        time.sleep(1.0)
+        received, elapsed, cpu = asyncio.run(load(server.pid, {"diffs": 0}))
+    finally:
+        server.terminate()
+        server.wait()
+    rate = received / elapsed / ROOMS
+    print(f"{ROOMS} rooms at {1000 / SPEED:.0f} Hz over {CONNECTIONS} connections for {elapsed:.1f} s")
+    print(f"diffs received: {received:,} ({rate:.2f} per room per second)")
+    print(f"server CPU: {cpu / elapsed:.0%} of one core")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Snapshot Benchmark
+Size and round-trip time of SnakeGame.to_bytes / from_bytes against snake
+length on a 30x30 board, next to pickling the whole object.
+
+Usage: python benchmarks/bench_snapshot.py
+"""
+
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import SnakeGame
+from snake_core.hamiltonian import HamiltonianSolver
+
+GRID_SIZE = 30
+LENGTHS = [1, 100, 450, 900]
+MIN_SECONDS = 0.5
+
+
+def play_to(length: int) -> SnakeGame:
+    """Game whose snake has reached `length` (900 is a won, full board)"""
+    game = SnakeGame(GRID_SIZE, seed=0)
+    game.game_started = True
+    solver = HamiltonianSolver(GRID_SIZE)
+    while len(game.snake) < length and not game.game_over:
+        game.change_direction(solver.next_direction(game))
+        game.move_snake()
+    return game
+
+
+def per_call(fn, arg) -> float:
+    """Mean microseconds per call, repeated for at least MIN_SECONDS"""
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < MIN_SECONDS:
+        for _ in range(100):
+            fn(arg)
+        calls += 100
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    print(f"{'length':>7} {'bytes':>6} {'to us':>8} {'from us':>8} {'pickle bytes':>13} {'pickle rt us':>13}")
+    for length in LENGTHS:
+        game = play_to(length)
+        data = game.to_bytes()
+        assert SnakeGame.from_bytes(data).to_bytes() == data
+        pickled = pickle.dumps(game)
+        to_us = per_call(SnakeGame.to_bytes, game)
+        from_us = per_call(SnakeGame.from_bytes, data)
+        pickle_us = per_call(lambda g: pickle.loads(pickle.dumps(g)), game)
+        print(f"{len(game.snake):>7} {len(data):>6} {to_us:>8.1f} {from_us:>8.1f} {len(pickled):>13} {pickle_us:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
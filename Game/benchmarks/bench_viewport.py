@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Viewport Benchmark
+Frame build time on large boards: a move_snake tick, then the 30x30 camera
+window on the head and the minimap (updated from dirty chunks only), against
+drawing the whole board. The viewport frame should stay flat as the board
+grows.
+
+Usage: python benchmarks/bench_viewport.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_core import DIRECTIONS, SnakeGame
+from snake_ui.render import Minimap, crop_viewport, render_grid_html, render_minimap_html
+
+GRID_SIZES = [30, 100, 250, 1000, 3000]
+FULL_RENDER_MAX = 1000  # Drawing the whole board beyond this takes seconds per frame
+MIN_SECONDS = 0.5
+
+
+def frames(grid_size: int, build) -> float:
+    """Milliseconds per tick + frame build, steering at random"""
+    game = SnakeGame(grid_size, seed=0)
+    game.game_started = True
+    minimap = Minimap(game.board)
+    rng = random.Random(0)
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < MIN_SECONDS:
+        if rng.random() < 0.1:
+            game.change_direction(rng.choice(DIRECTIONS))
+        game.move_snake()
+        if game.game_over:
+            game.reset_game()
+            game.game_started = True
+        build(game, minimap)
+        count += 1
+    return (time.perf_counter() - start) / count * 1e3
+
+
+def viewport_frame(game, minimap):
+    render_grid_html(crop_viewport(game.get_grid_state(), game.snake.head))
+    render_minimap_html(minimap, game.snake.head)
+
+
+def full_frame(game, minimap):
+    render_grid_html(game.get_grid_state())
+
+
+def main():
+    print(f"{'grid':>10} {'viewport + minimap ms':>22} {'whole board ms':>15}")
+    for grid_size in GRID_SIZES:
+        viewport = frames(grid_size, viewport_frame)
+        full = f"{frames(grid_size, full_frame):>15.2f}" if grid_size <= FULL_RENDER_MAX else f"{'-':>15}"
+        print(f"{grid_size:>5}x{grid_size:<4} {viewport:>22.2f} {full}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Regression Benchmark Suite
+One run of the numbers that matter for a frame, saved as JSON so two runs
+can be compared: move_snake ticks/sec against snake length, generate_food
+cost against board fill ratio, frame-build time (grid, camera window,
+markup) against grid size, and the full script rerun of both apps in
+Streamlit's headless AppTest harness. Nothing touches the network; the apps'
+leaderboard and replays go to a temporary directory.
+
+Each figure is the best of --repeat measurements, which keeps scheduler
+noise out of the comparison. compare flags every figure that got worse
+than the baseline by more than --threshold (a fraction) and exits 1 if any did.
+
+Usage: python benchmarks/suite.py run [--out results.json] [--quick] [--only engine food frame apps]
+       python benchmarks/suite.py run --baseline baseline.json [--threshold 0.25]
+       python benchmarks/suite.py compare baseline.json results.json [--threshold 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+
+import bench_generate_food
+import bench_move_snake
+from snake_core import SnakeBody, SnakeGame
+from snake_ui.render import VIEWPORT_SIZE, crop_viewport, render_grid_html
+
+SECTIONS = ("engine", "food", "frame", "apps")
+FRAME_GRID_SIZES = [10, 20, 30, 100, 1000]
+FRAME_STYLE = "text-align: center; font-family: monospace; font-size: 1.3rem; line-height: 1.2;"
+APPS = [("basic", "snake_game.py", "clock"), ("enhanced", "snake_game_enhanced.py", "enhanced_clock")]
+RERUNS = 30
+THRESHOLD = 0.25
+
+# name -> {"value", "unit", "better": "higher" | "lower"}
+Results = Dict[str, Dict]
+
+
+def per_call(fn: Callable, min_seconds: float) -> float:
+    """Seconds per call of fn, timed over at least min_seconds"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / calls
+
+
+def best(measure: Callable[[], float], repeat: int, better: str) -> float:
+    values = [measure() for _ in range(repeat)]
+    return max(values) if better == "higher" else min(values)
+
+
+def engine_results(repeat: int, quick: bool) -> Results:
+    bench_move_snake.MIN_SECONDS = 0.1 if quick else 0.5
+    results = {}
+    for length in bench_move_snake.LENGTHS:
+        value = best(lambda: bench_move_snake.run(SnakeGame, length), repeat, "higher")
+        results[f"move_snake/length={length}"] = {"value": value, "unit": "ticks/s", "better": "higher"}
+    return results
+
+
+def food_results(repeat: int, quick: bool) -> Results:
+    bench_generate_food.MIN_SECONDS = 0.05 if quick else 0.2
+    size = bench_generate_food.GRID_SIZE
+    cells = [(x, y) for y in range(size) for x in range(size)]
+    rng = random.Random(0)
+    results = {}
+    for ratio in bench_generate_food.FILL_RATIOS:
+        game = SnakeGame(size, seed=0)
+        game.snake = SnakeBody(size, rng.sample(cells, int(len(cells) * ratio)))
+        value = best(lambda: bench_generate_food.timed(SnakeGame.generate_food, game), repeat, "lower")
+        results[f"generate_food/fill={ratio}"] = {"value": value, "unit": "us", "better": "lower"}
+    return results
+
+
+def frame_results(repeat: int, quick: bool) -> Results:
+    """One frame of the server-side loop after the tick: grid, camera window on large boards, markup"""
+    results = {}
+    for grid_size in FRAME_GRID_SIZES:
+        game = SnakeGame(grid_size, seed=0)
+        game.game_started = True
+        for i in range(grid_size * 2):
+            game.change_direction([(1, 0), (0, 1)][i // 7 % 2])
+            game.move_snake()
+
+        def build():
+            grid = game.get_grid_state()
+            if game.grid_size > VIEWPORT_SIZE:
+                grid = crop_viewport(grid, game.snake.head)
+            return render_grid_html(grid, FRAME_STYLE)
+
+        value = best(lambda: per_call(build, 0.05 if quick else 0.2), repeat, "lower") * 1e6
+        results[f"frame_build/grid={grid_size}"] = {"value": value, "unit": "us", "better": "lower"}
+    return results
+
+
+def app_results(repeat: int, quick: bool) -> Results:
+    """Median time of the script thread over AppTest reruns of each app with a
+    game running, one tick per rerun.
+
+    The apps end each frame with a sleep until the next tick and st.rerun();
+    both are skipped for the script thread, and the session's clock is
+    restarted before each rerun so the rerun ticks once. The run is timed
+    inside the script thread: AppTest polls for completion every 100 ms on the
+    calling thread, so the caller's wall time would only measure the poll
+    interval (the poll is cut to 1 ms here so the suite does not idle).
+    """
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+    real_sleep, real_rerun = time.sleep, st.rerun
+    real_run_script, real_finished = LocalScriptRunner._run_script, LocalScriptRunner._on_script_finished
+    script_start = [0.0]
+    script_times: List[float] = []
+
+    def timed_run_script(runner, rerun_data):
+        script_start[0] = time.perf_counter()
+        real_run_script(runner, rerun_data)
+
+    def timed_finished(runner, *args, **kwargs):
+        # Recorded before the stop event is sent, which is what the caller waits for
+        script_times.append(time.perf_counter() - script_start[0])
+        real_finished(runner, *args, **kwargs)
+
+    caller = threading.current_thread()
+    time.sleep = lambda seconds: real_sleep(min(seconds, 0.001)) if threading.current_thread() is caller else None
+    st.rerun = lambda *args, **kwargs: None
+    LocalScriptRunner._run_script, LocalScriptRunner._on_script_finished = timed_run_script, timed_finished
+    reruns = 10 if quick else RERUNS
+    results = {}
+    try:
+        for name, script, clock_key in APPS:
+            def measure():
+                at = AppTest.from_file(os.path.join(GAME_DIR, script), default_timeout=60)
+                at.run()
+                [button for button in at.button if "Start" in button.label][0].click().run()
+                times = []
+                for _ in range(reruns):
+                    at.session_state[clock_key].restart()
+                    script_times.clear()
+                    at.run()
+                    times.append(script_times[-1])
+                    if at.exception:
+                        raise RuntimeError(f"{script} raised: {at.exception[0].message}")
+                return statistics.median(times) * 1000
+
+            results[f"app_rerun/{name}"] = {"value": best(measure, repeat, "lower"), "unit": "ms", "better": "lower"}
+    finally:
+        time.sleep, st.rerun = real_sleep, real_rerun
+        LocalScriptRunner._run_script, LocalScriptRunner._on_script_finished = real_run_script, real_finished
+    return results
+
+
+def run_suite(sections: List[str], repeat: int, quick: bool) -> Dict:
+    results: Results = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        # Read when the apps first import the leaderboard and replay modules (in this process)
+        os.environ["SNAKE_SCORES_DB"] = os.path.join(scratch, "scores.db")
+        os.environ["SNAKE_REPLAY_DIR"] = os.path.join(scratch, "replays")
+        for section in sections:
+            print(f"running {section}...", file=sys.stderr)
+            section_results = {"engine": engine_results, "food": food_results,
+                               "frame": frame_results, "apps": app_results}[section](repeat, quick)
+            for name, result in section_results.items():
+                print(f"  {name:<32} {result['value']:>14,.2f} {result['unit']}", file=sys.stderr)
+            results.update(section_results)
+    return {
+        "meta": {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+                 "platform": platform.platform(), "quick": quick, "repeat": repeat},
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[Tuple[str, float]]:
+    """Print every figure's change; returns (name, change) of those that regressed past threshold.
+
+    Change is relative and signed so that positive is worse, whichever way
+    the figure is better.
+    """
+    regressions = []
+    print(f"{'benchmark':<32} {'baseline':>14} {'current':>14} {'better by':>10}")
+    for name, result in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"{name:<32} {'-':>14} {result['value']:>14,.2f} {'new':>10}")
+            continue
+        ratio = result["value"] / old["value"]
+        worse = 1 / ratio - 1 if result["better"] == "higher" else ratio - 1
+        flag = ""
+        if worse > threshold:
+            regressions.append((name, worse))
+            flag = "  REGRESSED"
+        print(f"{name:<32} {old['value']:>14,.2f} {result['value']:>14,.2f} {-worse:>+10.1%}{flag}")
+    for name in sorted(baseline["results"].keys() - current["results"].keys()):
+        print(f"{name:<32} {'(not run)':>14}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the regression benchmarks or compare two runs")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="Measure and write JSON results")
+    run.add_argument("--out", default=None, help="Results file (default: print to stdout)")
+    run.add_argument("--only", nargs="+", choices=SECTIONS, default=list(SECTIONS))
+    run.add_argument("--repeat", type=int, default=3, help="Measurements per figure; the best is kept")
+    run.add_argument("--quick", action="store_true", help="Shorter timings, for a smoke test")
+    run.add_argument("--baseline", default=None, help="Compare against these results afterwards")
+    run.add_argument("--threshold", type=float, default=THRESHOLD)
+    check = commands.add_parser("compare", help="Compare two results files")
+    check.add_argument("baseline")
+    check.add_argument("current")
+    check.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        current = run_suite([section for section in SECTIONS if section in args.only], args.repeat, args.quick)
+        if args.out is None:
+            json.dump(current, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.out, "w") as f:
+                json.dump(current, f, indent=2)
+        if args.baseline is None:
+            return
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+    print(f"no regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
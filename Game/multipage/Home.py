@@ -0,0 +1,20 @@
+"""
+Snake Game multipage app
+Hosts both game variants on one long-lived Streamlit server (see run_game.py).
+"""
+
+import os
+import sys
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
+
+import streamlit as st
+
+st.set_page_config(page_title="Snake Game", page_icon="🐍", layout="wide")
+
+st.markdown("# 🐍 Snake Game")
+st.markdown("Pick a version in the sidebar. Both run on this server, so switching between them is instant.")
+st.markdown("- **Basic**: the classic game with arrow-button controls\n"
+            "- **Enhanced**: pause, leaderboard, replays and the in-browser game loop")
@@ -0,0 +1,10 @@
+import os
+import sys
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
+
+from snake_game import create_game_ui
+
+create_game_ui()
@@ -2,44 +2,127 @@
 """
 Snake Game Launcher
 Choose between basic and enhanced versions of the Snake game.
+
+Both versions are pages of one Streamlit app (multipage/) served from this
+process, so switching version is a page change rather than a server restart.
+
+Usage: python run_game.py [--variant basic|enhanced] [--port 8501] [--headless]
+       python run_game.py --check [--port 8501] [--timeout 10]
 """
 
-import subprocess
-import sys
+import argparse
 import os
+import sys
+import threading
+import time
+import urllib.request
+import webbrowser
 
-def main():
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(GAME_DIR, "multipage", "Home.py")
+# Variant name -> URL path of its page (derived by Streamlit from the file name)
+VARIANTS = {"basic": "Basic", "enhanced": "Enhanced"}
+DEFAULT_PORT = 8501
+READY_TIMEOUT = 30.0
+
+
+def is_ready(port: int, timeout: float = 1.0) -> bool:
+    """True if a Streamlit server on this port answers its health endpoint"""
+    try:
+        with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=timeout) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+def wait_until_ready(port: int, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while True:
+        if is_ready(port):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+def warm_up():
+    """Import the engine, both front-ends and Streamlit before the server
+    starts, so the first run of either page finds them in sys.modules"""
+    import numpy  # noqa: F401
+    import snake_core.replay  # noqa: F401
+    import snake_game  # noqa: F401
+    import snake_game_enhanced  # noqa: F401
+    import snake_ui.debug  # noqa: F401
+    import snake_ui.render  # noqa: F401
+    import streamlit.components.v1  # noqa: F401  (snake_ui.client declares its component on first use)
+
+def announce_when_ready(port: int, url: str, started: float, open_browser: bool):
+    if not wait_until_ready(port, READY_TIMEOUT):
+        print(f"❌ Server did not become ready on port {port} within {READY_TIMEOUT:.0f}s")
+        return
+    print(f"✅ Ready in {time.perf_counter() - started:.2f}s: {url}")
+    if open_browser:
+        webbrowser.open(url)
+
+def serve(variant: str, port: int, headless: bool):
+    """Run the multipage app in this process; blocks until the server stops"""
+    started = time.perf_counter()
+    # Set before Streamlit is imported so its config loads once with these values.
+    # Streamlit's own browser opening would land on the home page, not the chosen variant.
+    os.environ["STREAMLIT_SERVER_PORT"] = str(port)
+    os.environ["STREAMLIT_SERVER_HEADLESS"] = "true"
+    from streamlit.web import cli as stcli
+
+    if GAME_DIR not in sys.path:
+        sys.path.insert(0, GAME_DIR)
+    warm_up()
+    url = f"http://localhost:{port}/{VARIANTS[variant]}"
+    threading.Thread(target=announce_when_ready, args=(port, url, started, not headless), daemon=True).start()
+    stcli.main(["run", APP_PATH], prog_name="streamlit")
+
+def choose_variant():
     print("🐍 Snake Game Launcher")
     print("=" * 30)
     print("Choose your game version:")
     print("1. Basic Snake Game (snake_game.py)")
     print("2. Enhanced Snake Game (snake_game_enhanced.py)")
     print("3. Exit")
-    
+
     while True:
         try:
             choice = input("\nEnter your choice (1-3): ").strip()
-            
+
             if choice == "1":
                 print("\n🚀 Starting Basic Snake Game...")
-                subprocess.run([sys.executable, "-m", "streamlit", "run", "snake_game.py"])
-                break
+                return "basic"
             elif choice == "2":
                 print("\n🚀 Starting Enhanced Snake Game...")
-                subprocess.run([sys.executable, "-m", "streamlit", "run", "snake_game_enhanced.py"])
-                break
+                return "enhanced"
             elif choice == "3":
                 print("\n👋 Goodbye!")
-                break
+                return None
             else:
                 print("❌ Invalid choice. Please enter 1, 2, or 3.")
-                
-        except KeyboardInterrupt:
+
+        except (KeyboardInterrupt, EOFError):
             print("\n\n👋 Goodbye!")
-            break
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            break
+            return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Snake game (both versions) on one Streamlit server.")
+    parser.add_argument("--variant", choices=sorted(VARIANTS),
+                        help="version to open; asks interactively when omitted")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--headless", action="store_true", help="do not open a browser")
+    parser.add_argument("--check", action="store_true",
+                        help="exit 0 once a server on --port is ready, 1 if it is not ready within --timeout")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds to wait with --check")
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(0 if wait_until_ready(args.port, args.timeout) else 1)
+
+    variant = args.variant or choose_variant()
+    if variant is not None:
+        serve(variant, args.port, args.headless)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,5 @@
+"""Snake game engine: the rules, board and body in pure Python (no Streamlit or NumPy import)"""
+
+from .body import SnakeBody
+from .game import DIRECTIONS, DOWN, LEFT, RIGHT, UP, SnakeGame
+from .grid import BODY, EMPTY, FOOD, HEAD, BoardGrid
@@ -0,0 +1,171 @@
+import random
+from array import array
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from .game import DIRECTIONS
+
+Cell = Tuple[int, int]
+
+# Values of Arena.owner besides snake ids (snake k is stored as k + 1)
+EMPTY = 0
+FOOD = -1
+
+
+class ArenaSnake:
+    """One snake of an arena: segment cell indices (head first), heading and score"""
+
+    def __init__(self, snake_id: int):
+        self.snake_id = snake_id
+        self.segments: Deque[int] = deque()
+        self.direction = DIRECTIONS[1]
+        self.alive = False
+        self.score = 0
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+
+class Arena:
+    """Many snakes and food items on one wrap-around board, moved simultaneously.
+
+    All collision checks go through one shared occupancy index, ``owner``
+    (a flat int array: EMPTY, FOOD or snake id + 1 per cell), so a tick costs
+    one lookup per snake however long the snakes are. Cells that are neither
+    snake nor food are kept in a swap-remove array with a position map, so
+    spawning food or a snake is O(1) on any board.
+
+    Rules per tick, applied to every living snake at once:
+      - a head entering a cell occupied before the tick (any snake, including
+        tails about to move on, as in SnakeGame) kills that snake
+      - two or more heads entering the same cell kill all of them
+      - a head entering food scores +10, grows by one and respawns the food
+    Dead snakes leave the board immediately; ``respawn`` brings one back.
+    """
+
+    def __init__(self, grid_size: int = 100, num_snakes: int = 10, num_food: Optional[int] = None,
+                 seed: Optional[int] = None):
+        self.grid_size = grid_size
+        self.rng = random.Random(seed)
+        cells = grid_size * grid_size
+        self.owner = array("i", bytes(4 * cells))
+        self.free: List[int] = list(range(cells))
+        self.free_slot: List[int] = list(range(cells))
+        self.num_food = num_snakes if num_food is None else num_food
+        self.food_count = 0
+        self.snakes = [ArenaSnake(snake_id) for snake_id in range(num_snakes)]
+        for snake_id in range(num_snakes):
+            self.respawn(snake_id)
+        self._spawn_food()
+
+    def _occupy(self, index: int, value: int):
+        self.owner[index] = value
+        slot = self.free_slot[index]
+        last = self.free.pop()
+        if last != index:
+            self.free[slot] = last
+            self.free_slot[last] = slot
+        self.free_slot[index] = -1
+
+    def _release(self, index: int):
+        self.owner[index] = EMPTY
+        self.free_slot[index] = len(self.free)
+        self.free.append(index)
+
+    def _random_free_index(self) -> Optional[int]:
+        if not self.free:
+            return None
+        return self.free[self.rng.randrange(len(self.free))]
+
+    def _spawn_food(self):
+        while self.food_count < self.num_food:
+            index = self._random_free_index()
+            if index is None:
+                return
+            self._occupy(index, FOOD)
+            self.food_count += 1
+
+    def respawn(self, snake_id: int) -> bool:
+        """Put a dead (or new) snake back as a single segment on a random free cell"""
+        index = self._random_free_index()
+        if index is None:
+            return False
+        snake = self.snakes[snake_id]
+        self._kill(snake)
+        snake.segments.append(index)
+        snake.direction = self.rng.choice(DIRECTIONS)
+        snake.alive = True
+        snake.score = 0
+        self._occupy(index, snake_id + 1)
+        return True
+
+    def _kill(self, snake: ArenaSnake):
+        for index in snake.segments:
+            self._release(index)
+        snake.segments.clear()
+        snake.alive = False
+
+    def change_direction(self, snake_id: int, new_direction: Tuple[int, int]):
+        """Turn a living snake (180-degree turns are ignored, as in SnakeGame)"""
+        snake = self.snakes[snake_id]
+        if snake.alive and (new_direction[0] != -snake.direction[0] or new_direction[1] != -snake.direction[1]):
+            snake.direction = new_direction
+
+    def step(self, actions: Optional[Sequence[Optional[Tuple[int, int]]]] = None) -> List[int]:
+        """Apply optional per-snake turns, move every living snake once and
+        return the ids of the snakes that died this tick"""
+        if actions is not None:
+            for snake_id, direction in enumerate(actions):
+                if direction is not None:
+                    self.change_direction(snake_id, direction)
+
+        size = self.grid_size
+        owner = self.owner
+        moves: List[Tuple[ArenaSnake, int]] = []
+        dead: List[ArenaSnake] = []
+        heads: Dict[int, int] = {}
+        for snake in self.snakes:
+            if not snake.alive:
+                continue
+            head = snake.segments[0]
+            dx, dy = snake.direction
+            new_head = ((head // size + dy) % size) * size + (head % size + dx) % size
+            if owner[new_head] > 0:
+                dead.append(snake)
+            else:
+                moves.append((snake, new_head))
+                heads[new_head] = heads.get(new_head, 0) + 1
+
+        for snake, new_head in moves:
+            if heads[new_head] > 1:
+                dead.append(snake)
+        for snake in dead:
+            self._kill(snake)
+
+        for snake, new_head in moves:
+            if not snake.alive:
+                continue
+            value = snake.snake_id + 1
+            if owner[new_head] == FOOD:
+                owner[new_head] = value  # Food cells are already out of the free array
+                self.food_count -= 1
+                snake.score += 10
+            else:
+                self._occupy(new_head, value)
+                self._release(snake.segments.pop())
+            snake.segments.appendleft(new_head)
+        self._spawn_food()
+        return [snake.snake_id for snake in dead]
+
+    def head(self, snake_id: int) -> Cell:
+        index = self.snakes[snake_id].segments[0]
+        return (index % self.grid_size, index // self.grid_size)
+
+    def snake_at(self, cell: Cell) -> Optional[int]:
+        """Id of the snake covering a cell, or None"""
+        value = self.owner[cell[1] * self.grid_size + cell[0]]
+        return value - 1 if value > 0 else None
+
+    def food_cells(self) -> List[Cell]:
+        size = self.grid_size
+        return [(index % size, index // size) for index, value in enumerate(self.owner) if value == FOOD]
@@ -0,0 +1,124 @@
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from .game import DIRECTIONS, SnakeGame
+from .grid import BODY, EMPTY, FOOD, HEAD
+
+Cell = Tuple[int, int]
+
+# Board cell values -> b"1" for cells a path may not enter, b"0" otherwise
+_BLOCKED = bytes.maketrans(bytes([EMPTY, BODY, HEAD, FOOD]), b"0110")
+
+
+class Autopilot:
+    """Plays a SnakeGame by itself: shortest path to the food on the wrapped
+    grid, following its own tail when the food cannot be reached.
+
+    The search is a breadth-first wavefront on bitboards: the board is one
+    Python int with bit y * grid_size + x per cell, and each distance ring
+    is a dozen shifts and masks over the whole board, whatever its size.
+    A path to the food stays valid until the food moves: the only obstacle
+    is the snake itself, which only ever covers cells already walked. So the
+    planner searches once per food and then just follows the cached path.
+    Body cells count as obstacles, and so does the tail on the first step,
+    because SnakeGame checks the move before the tail leaves.
+    """
+
+    def __init__(self, grid_size: int):
+        n = grid_size
+        self.grid_size = n
+        self.cells = n * n
+        self.full = (1 << self.cells) - 1
+        self.first_col = sum(1 << (y * n) for y in range(n))
+        self.last_col = self.first_col << (n - 1)
+        self.first_row = (1 << n) - 1
+        self.path: Deque[Cell] = deque()  # Cells still to visit, ending at target
+        self.target: Optional[Cell] = None
+
+    def next_direction(self, game: SnakeGame) -> Optional[Tuple[int, int]]:
+        """Direction for the coming tick, or None to keep going (no safe move)"""
+        head = game.snake.head
+        path = self.path
+        while path and path[0] == head:
+            path.popleft()
+        if path and self.target == game.food and path[0] not in game.snake:
+            direction = self._step(head, path[0])
+            if direction is not None:
+                return direction
+
+        path.clear()
+        self.target = None
+        rings, reached = self._search(game)
+        if reached == game.food:
+            self.target = reached
+            self._trace(rings, reached)
+            return self._step(head, path[0])
+        if reached is not None:
+            # The tail moves every tick, so this path is not kept
+            self._trace(rings, reached)
+            direction = self._step(head, path[0])
+            path.clear()
+            return direction
+
+        n = self.grid_size
+        for direction in [game.direction] + DIRECTIONS:
+            cell = ((head[0] + direction[0]) % n, (head[1] + direction[1]) % n)
+            if cell not in game.snake:
+                return direction
+        return None
+
+    def _step(self, start: Cell, end: Cell) -> Optional[Tuple[int, int]]:
+        """Direction from a cell to a wrap-around neighbour (None if not adjacent)"""
+        n = self.grid_size
+        direction = ((end[0] - start[0] + 1) % n - 1, (end[1] - start[1] + 1) % n - 1)
+        return direction if direction in DIRECTIONS else None
+
+    def _spread(self, bits: int) -> int:
+        """Every wrap-around neighbour of the set cells"""
+        n, cells = self.grid_size, self.cells
+        return (((bits << n) & self.full) | (bits >> (cells - n))                      # y + 1
+                | (bits >> n) | ((bits & self.first_row) << (cells - n))                # y - 1
+                | ((bits & ~self.last_col) << 1) | ((bits & self.last_col) >> (n - 1))  # x + 1
+                | ((bits & ~self.first_col) >> 1) | ((bits & self.first_col) << (n - 1)))  # x - 1
+
+    def _search(self, game: SnakeGame) -> Tuple[List[int], Optional[Cell]]:
+        """Wavefront from the head, one bitboard per distance ring, until it
+        reaches the food (or, failing that, the tail) or runs out of cells.
+        Returns the rings and the cell reached (None if neither)"""
+        n = self.grid_size
+        head = game.snake.head
+        head_bit = 1 << (head[1] * n + head[0])
+        open_cells = self.full ^ int(game.board.cells.translate(_BLOCKED)[::-1], 2)
+        tail = game.snake.tail
+        tail_bit = 1 << (tail[1] * n + tail[0]) if len(game.snake) > 2 else 0
+        food_bit = 1 << (game.food[1] * n + game.food[0]) if game.food is not None else 0
+        tail_reached = False
+        rings = [head_bit]
+        frontier = head_bit
+        while True:
+            frontier = self._spread(frontier) & open_cells
+            if not frontier:
+                return rings, tail if tail_reached else None
+            rings.append(frontier)
+            open_cells ^= frontier
+            if frontier & food_bit:
+                return rings, game.food
+            if frontier & tail_bit:
+                tail_reached = True
+            if len(rings) == 2:
+                open_cells |= tail_bit  # The tail cell is free from the second step on
+
+    def _trace(self, rings: List[int], target: Cell):
+        """Rebuild the path to target by walking the rings back down to the head
+        (rings past the one holding target are skipped)"""
+        n = self.grid_size
+        x, y = target
+        for ring in range(len(rings) - 1, 0, -1):
+            if not (rings[ring] >> (y * n + x)) & 1:
+                continue
+            self.path.appendleft((x, y))
+            for dx, dy in DIRECTIONS:
+                px, py = (x + dx) % n, (y + dy) % n
+                if (rings[ring - 1] >> (py * n + px)) & 1:
+                    x, y = px, py
+                    break
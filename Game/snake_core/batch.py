@@ -0,0 +1,141 @@
+import numpy as np
+from typing import Optional, Tuple
+
+from .game import DIRECTIONS
+
+# Direction indices used as actions (positions in DIRECTIONS); opposite of d is (d + 2) % 4
+UP, RIGHT, DOWN, LEFT = 0, 1, 2, 3
+NOOP = -1
+DX = np.array([dx for dx, _ in DIRECTIONS], dtype=np.int32)
+DY = np.array([dy for _, dy in DIRECTIONS], dtype=np.int32)
+
+
+class BatchSnakeEnv:
+    """Headless engine that advances many boards in lockstep.
+
+    Follows the same rules as SnakeGame.move_snake/change_direction:
+    wrap-around walls, 180-degree turns are ignored, hitting any body cell
+    (including the tail that is about to move) ends the game, +10 per food,
+    and filling the whole grid is a win.
+
+    Each board's body is a ring buffer of flat cell indices (y * grid_size + x)
+    in ``body[b]``, with the head at ``head_ptr[b]`` and ``length[b]``
+    segments, plus an occupancy bitmap, so a step is a fixed number of
+    vectorised NumPy operations regardless of snake length. Food is -1 once
+    the grid is full.
+    """
+
+    def __init__(self, num_boards: int, grid_size: int = 20, seed: Optional[int] = None):
+        self.num_boards = num_boards
+        self.grid_size = grid_size
+        self.num_cells = grid_size * grid_size
+        self.rng = np.random.default_rng(seed)
+        self.rows = np.arange(num_boards)
+
+        self.body = np.zeros((num_boards, self.num_cells), dtype=np.int32)
+        self.occupied = np.zeros((num_boards, self.num_cells), dtype=np.uint8)
+        self.head_ptr = np.zeros(num_boards, dtype=np.int32)
+        self.length = np.zeros(num_boards, dtype=np.int32)
+        self.direction = np.zeros(num_boards, dtype=np.int8)
+        self.food = np.zeros(num_boards, dtype=np.int32)
+        self.score = np.zeros(num_boards, dtype=np.int32)
+        self.steps = np.zeros(num_boards, dtype=np.int32)
+        self.game_over = np.zeros(num_boards, dtype=bool)
+        self.won = np.zeros(num_boards, dtype=bool)
+        self.reset()
+
+    @property
+    def heads(self) -> np.ndarray:
+        """Flat cell index of every head"""
+        return self.body[self.rows, self.head_ptr]
+
+    def reset(self, mask: Optional[np.ndarray] = None):
+        """Reset the boards selected by a boolean mask (all boards if None)"""
+        idx = self.rows if mask is None else np.flatnonzero(mask)
+        if idx.size == 0:
+            return
+        center = self.grid_size // 2
+        start = center * self.grid_size + center
+        self.occupied[idx] = 0
+        self.occupied[idx, start] = 1
+        self.body[idx, 0] = start
+        self.head_ptr[idx] = 0
+        self.length[idx] = 1
+        self.direction[idx] = RIGHT
+        self.score[idx] = 0
+        self.steps[idx] = 0
+        self.game_over[idx] = False
+        self.won[idx] = False
+        self._spawn_food(idx)
+
+    def _spawn_food(self, idx: np.ndarray):
+        """Place food on a uniformly random free cell of each selected board"""
+        free = self.occupied[idx] == 0
+        free_count = free.sum(axis=1)
+        target = (self.rng.random(idx.size) * free_count).astype(np.int64)
+        # k-th free cell: first position where the running free count exceeds k
+        cells = (np.cumsum(free, axis=1) > target[:, None]).argmax(axis=1)
+        self.food[idx] = np.where(free_count > 0, cells, -1)
+
+    def step(self, actions: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Apply one direction change per board (NOOP keeps it) and advance every live board.
+
+        Returns (rewards, dones): the score gained this step and the boards
+        whose game ended this step. Finished boards stay frozen until reset.
+        """
+        rewards = np.zeros(self.num_boards, dtype=np.int32)
+        dones = np.zeros(self.num_boards, dtype=bool)
+        live = np.flatnonzero(~self.game_over)
+        if live.size == 0:
+            return rewards, dones
+
+        direction = self.direction[live]
+        if actions is not None:
+            action = np.asarray(actions)[live]
+            turn = (action >= 0) & (action != (direction + 2) % 4)
+            direction = np.where(turn, action, direction).astype(np.int8)
+            self.direction[live] = direction
+
+        size = self.grid_size
+        ptr = self.head_ptr[live]
+        head = self.body[live, ptr]
+        new_head = ((head // size + DY[direction]) % size) * size + (head % size + DX[direction]) % size
+        self.steps[live] += 1
+
+        # Collision is checked before the tail moves, like move_snake
+        hit = self.occupied[live, new_head] == 1
+        if hit.any():
+            dead = live[hit]
+            self.game_over[dead] = True
+            dones[dead] = True
+            live, ptr, new_head = live[~hit], ptr[~hit], new_head[~hit]
+
+        length = self.length[live]
+        tail_ptr = (ptr - length + 1) % self.num_cells
+        ptr = (ptr + 1) % self.num_cells
+        self.head_ptr[live] = ptr
+        self.body[live, ptr] = new_head
+        self.occupied[live, new_head] = 1
+
+        ate = new_head == self.food[live]
+        grow = live[ate]
+        stay = ~ate
+        self.occupied[live[stay], self.body[live[stay], tail_ptr[stay]]] = 0
+
+        if grow.size:
+            self.length[grow] += 1
+            self.score[grow] += 10
+            rewards[grow] = 10
+            self._spawn_food(grow)
+            full = grow[self.length[grow] >= self.num_cells]
+            self.game_over[full] = True
+            self.won[full] = True
+            dones[full] = True
+
+        return rewards, dones
+
+    def snake_cells(self, board: int) -> list:
+        """Body of one board as (x, y) tuples, head first (for checks and rendering)"""
+        ptr, length = self.head_ptr[board], self.length[board]
+        cells = self.body[board, (ptr - np.arange(length)) % self.num_cells]
+        return [(int(c) % self.grid_size, int(c) // self.grid_size) for c in cells]
@@ -0,0 +1,190 @@
+import random
+from array import array
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+Cell = Tuple[int, int]
+
+# Cells per free-count block: a spawn that falls back to counting walks the
+# block counts, then bisects a single block
+BLOCK_BITS = 10
+BLOCK_SIZE = 1 << BLOCK_BITS
+
+# Uniform draws over the whole board tried before counting to a free cell
+SPAWN_TRIES = 4
+
+# Move codes of from_moves: UP, RIGHT, DOWN, LEFT as in game.DIRECTIONS
+MOVES = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+# Largest board whose neighbour and cell tables are cached for from_moves
+WALK_TABLE_MAX = 128
+
+
+@lru_cache(maxsize=4)
+def _walk_tables(grid_size: int) -> Tuple[List[List[int]], List[Cell]]:
+    """For each move code, the neighbour index of every cell; and every cell as a tuple"""
+    cells = [(x, y) for y in range(grid_size) for x in range(grid_size)]
+    steps = [[(x + dx) % grid_size + (y + dy) % grid_size * grid_size for x, y in cells] for dx, dy in MOVES]
+    return steps, cells
+
+
+class SnakeBody:
+    """Snake segments (head first) with a constant-time occupancy lookup.
+
+    The segments live in a deque so the head can be pushed and the tail
+    popped in O(1), and a flat bytearray marks every occupied cell so that
+    ``cell in body`` no longer scans the whole snake.
+
+    Random empty cells depend only on the RNG and the set of occupied cells,
+    never on the order the snake took them, so a body rebuilt from its cells
+    (e.g. a restored snapshot) spawns the same food as the original. A spawn
+    first tries a few uniform draws over the board, which almost always land
+    on a free cell unless the board is nearly full, and otherwise picks the
+    k-th free cell in cell order, found through the free count of each
+    BLOCK_SIZE-cell block (``free_blocks``).
+    """
+
+    __slots__ = ("grid_size", "segments", "occupied", "free_count", "free_blocks")
+
+    def __init__(self, grid_size: int, segments: Iterable[Cell] = ()):
+        self._reset(grid_size)
+        for segment in segments:
+            self.segments.append(segment)
+            self._occupy(segment[1] * grid_size + segment[0])
+
+    def _reset(self, grid_size: int):
+        size = grid_size * grid_size
+        self.grid_size = grid_size
+        self.segments: Deque[Cell] = deque()
+        self.occupied = bytearray(size)
+        self.free_count = size
+        self.free_blocks = array("i", [BLOCK_SIZE]) * -(-size // BLOCK_SIZE)
+        self.free_blocks[-1] = size - (len(self.free_blocks) - 1) * BLOCK_SIZE
+
+    @classmethod
+    def from_cells(cls, grid_size: int, cells: Sequence[Cell]) -> "SnakeBody":
+        """Body over the given cells (head first), built in one pass rather
+        than one _occupy per segment"""
+        body = cls.__new__(cls)
+        body._reset(grid_size)
+        body.segments.extend(cells)
+        occupied = body.occupied
+        for x, y in cells:
+            occupied[y * grid_size + x] = 1
+        body._count_free()
+        return body
+
+    @classmethod
+    def from_moves(cls, grid_size: int, head: int, moves: bytes) -> "SnakeBody":
+        """Body walked from the head cell index along move codes (indices into
+        MOVES), one per segment after the head"""
+        body = cls.__new__(cls)
+        body._reset(grid_size)
+        occupied = body.occupied
+        occupied[head] = 1
+        if grid_size <= WALK_TABLE_MAX:
+            # Table lookups instead of wrap arithmetic and a new tuple per segment
+            steps, cell_of = _walk_tables(grid_size)
+            cells = [cell_of[head]]
+            append = cells.append
+            for code in moves:
+                head = steps[code][head]
+                occupied[head] = 1
+                append(cell_of[head])
+        else:
+            x, y = head % grid_size, head // grid_size
+            cells = [(x, y)]
+            for code in moves:
+                dx, dy = MOVES[code]
+                x = (x + dx) % grid_size
+                y = (y + dy) % grid_size
+                occupied[y * grid_size + x] = 1
+                cells.append((x, y))
+        body.segments.extend(cells)
+        body._count_free()
+        return body
+
+    def _count_free(self):
+        """Set the free counts from ``occupied``, one C-level count per block"""
+        occupied = self.occupied
+        for block in range(len(self.free_blocks)):
+            self.free_blocks[block] -= occupied.count(1, block << BLOCK_BITS, (block + 1) << BLOCK_BITS)
+        self.free_count = sum(self.free_blocks)
+
+    def _occupy(self, index: int):
+        """Mark a cell as covered"""
+        self.occupied[index] = 1
+        self.free_blocks[index >> BLOCK_BITS] -= 1
+        self.free_count -= 1
+
+    def _release(self, index: int):
+        """Mark a cell as empty"""
+        self.occupied[index] = 0
+        self.free_blocks[index >> BLOCK_BITS] += 1
+        self.free_count += 1
+
+    @property
+    def head(self) -> Cell:
+        return self.segments[0]
+
+    @property
+    def tail(self) -> Cell:
+        return self.segments[-1]
+
+    def push_head(self, cell: Cell):
+        """Add a new head segment"""
+        self.segments.appendleft(cell)
+        self._occupy(cell[1] * self.grid_size + cell[0])
+
+    def pop_tail(self) -> Cell:
+        """Remove and return the tail segment"""
+        cell = self.segments.pop()
+        self._release(cell[1] * self.grid_size + cell[0])
+        return cell
+
+    def random_free_cell(self, rng: random.Random) -> Optional[Cell]:
+        """Pick a uniformly random cell not covered by the snake (None if the board is full)"""
+        if not self.free_count:
+            return None
+        occupied, randrange = self.occupied, rng.randrange
+        size = len(occupied)
+        for _ in range(SPAWN_TRIES):
+            index = randrange(size)
+            if not occupied[index]:
+                break
+        else:
+            index = self._nth_free(rng.randrange(self.free_count))
+        return (index % self.grid_size, index // self.grid_size)
+
+    def _nth_free(self, n: int) -> int:
+        """Index of the n-th (0-based) free cell in cell order"""
+        for block, count in enumerate(self.free_blocks):
+            if n < count:
+                break
+            n -= count
+        # Halve the block on the free count of its left part (bytearray.count runs in C)
+        occupied = self.occupied
+        lo = block << BLOCK_BITS
+        hi = min(lo + BLOCK_SIZE, len(occupied))
+        while hi - lo > 1:
+            mid = (lo + hi) >> 1
+            left = occupied.count(0, lo, mid)
+            if n < left:
+                hi = mid
+            else:
+                n -= left
+                lo = mid
+        return lo
+
+    def __contains__(self, cell) -> bool:
+        return self.occupied[cell[1] * self.grid_size + cell[0]] == 1
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def __iter__(self) -> Iterator[Cell]:
+        return iter(self.segments)
+
+    def __getitem__(self, index: int) -> Cell:
+        return self.segments[index]
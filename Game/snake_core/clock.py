@@ -0,0 +1,51 @@
+import time
+from typing import Optional
+
+
+class FixedStepClock:
+    """Fixed-timestep schedule for a game loop driven by script reruns.
+
+    Each frame asks ``due()`` how many ticks to run: one per deadline passed
+    since the last frame. The next deadline follows the previous one, not
+    the frame's wake-up time, so script, render and sleep overshoot never
+    add up, and the caller sleeps only for ``remaining()``. A late frame
+    runs several ticks and renders only the last one; past ``max_steps``
+    the rest are dropped (counted in ``missed``) instead of piling up. The
+    board steps exactly once per tick either way, so how it evolves does
+    not depend on how long rendering takes, and reruns triggered by button
+    clicks add no ticks.
+    """
+
+    def __init__(self, interval: float, max_steps: int = 5):
+        self.interval = interval  # Seconds per tick
+        self.max_steps = max_steps
+        self.deadline: Optional[float] = None  # time.monotonic() of the next tick; None runs one at once
+        self.lateness = 0.0  # How far past its deadline the last frame's first tick ran
+        self.caught_up = 0  # Extra ticks run by late frames
+        self.missed = 0  # Ticks dropped beyond max_steps
+
+    def restart(self):
+        """Drop the schedule so the next frame ticks at once (after a start or restart)"""
+        self.deadline = None
+
+    def due(self, now: Optional[float] = None) -> int:
+        """Ticks to run in this frame (0 if the next deadline has not come yet)"""
+        now = time.monotonic() if now is None else now
+        if self.deadline is None:
+            self.deadline = now
+        if now < self.deadline:
+            return 0
+        self.lateness = now - self.deadline
+        passed = int(self.lateness // self.interval) + 1
+        self.deadline += passed * self.interval
+        steps = min(passed, self.max_steps)
+        self.caught_up += steps - 1
+        self.missed += passed - steps
+        return steps
+
+    def remaining(self, now: Optional[float] = None) -> float:
+        """Seconds to sleep until the next tick is due"""
+        if self.deadline is None:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, self.deadline - now)
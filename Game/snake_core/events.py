@@ -0,0 +1,214 @@
+import abc
+import atexit
+import json
+import logging
+import os
+import struct
+import threading
+import time
+from collections import deque
+from typing import BinaryIO, Deque, Iterator, List, NamedTuple, Optional, Sequence
+
+# Event kinds (the codes are what the binary format stores)
+TICK = 0       # x, y: new head; value: snake length
+TURN = 1       # x, y: head; value: new direction code (index into DIRECTIONS)
+FOOD = 2       # x, y: food eaten; value: score after eating
+PAUSE = 3      # x, y: head; value: 1 paused, 0 resumed
+GAME_OVER = 4  # x, y: cell the head moved into (on a collision, the body cell hit); value: final score
+KIND_NAMES = ("tick", "turn", "food", "pause", "game_over")
+
+# Log file for the apps (off when unset); ".jsonl" selects JSON lines, anything else the binary format
+EVENT_LOG = os.environ.get("SNAKE_EVENT_LOG")
+EVENT_LOG_MAX_BYTES = int(os.environ.get("SNAKE_EVENT_LOG_MAX_BYTES", 64 * 1024 * 1024))
+
+logger = logging.getLogger(__name__)
+
+
+class GameEvent(NamedTuple):
+    time: float  # Unix time
+    game_id: int
+    tick: int
+    kind: int
+    x: int
+    y: int
+    value: int
+
+
+class FileSink(abc.ABC):
+    """Appends encoded event batches to a file, rotating it once it grows
+    past ``max_bytes``: path -> path.1 -> ... -> path.<backups>, the oldest
+    dropped (like logging's RotatingFileHandler). Subclasses define the
+    encoding; any object with write(batch), flush() and close() can be
+    used as a sink.
+    """
+
+    header = b""
+
+    def __init__(self, path: str, max_bytes: Optional[int] = None, backups: int = 5):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._file = self._open()
+
+    def _open(self) -> BinaryIO:
+        f = open(self.path, "ab")
+        if f.tell() == 0:
+            f.write(self.header)
+        return f
+
+    @abc.abstractmethod
+    def encode(self, batch: Sequence[GameEvent]) -> bytes:
+        """The bytes appended to the file for a batch"""
+
+    def write(self, batch: Sequence[GameEvent]):
+        data = self.encode(batch)
+        if (self.max_bytes is not None and self._file.tell() > len(self.header)
+                and self._file.tell() + len(data) > self.max_bytes):
+            self._rotate()
+        self._file.write(data)
+
+    def _rotate(self):
+        self._file.close()
+        for index in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = self._open()
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class JsonLinesSink(FileSink):
+    """One JSON object per line, with the kind spelled out"""
+
+    def encode(self, batch: Sequence[GameEvent]) -> bytes:
+        lines = [json.dumps({"time": e.time, "game_id": e.game_id, "tick": e.tick, "kind": KIND_NAMES[e.kind],
+                             "x": e.x, "y": e.y, "value": e.value}, separators=(",", ":"))
+                 for e in batch]
+        return ("\n".join(lines) + "\n").encode()
+
+
+class BinarySink(FileSink):
+    """Fixed 25-byte little-endian records after a 5-byte file header"""
+
+    header = b"SNKE\x01"
+    record = struct.Struct("<dIIBhhi")
+
+    def encode(self, batch: Sequence[GameEvent]) -> bytes:
+        pack = self.record.pack
+        return b"".join([pack(*event) for event in batch])
+
+
+def read_events(path: str) -> Iterator[GameEvent]:
+    """Events from a log written by JsonLinesSink or BinarySink"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.startswith(BinarySink.header):
+        body = data[len(BinarySink.header):]
+        for fields in BinarySink.record.iter_unpack(body[:len(body) - len(body) % BinarySink.record.size]):
+            yield GameEvent(*fields)
+        return
+    for line in data.splitlines():
+        if line:
+            record = json.loads(line)
+            record["kind"] = KIND_NAMES.index(record["kind"])
+            yield GameEvent(**record)
+
+
+class EventBus:
+    """Hands game events from the engine to sinks without slowing the tick.
+
+    ``emit`` only appends a tuple to a bounded deque. When the deque is full
+    the event is dropped and counted in ``dropped`` instead of blocking, so
+    a slow disk costs log completeness, never tick latency. A background
+    thread drains the deque in batches of up to ``batch_size``, writes each
+    batch to every sink and flushes them, once per ``flush_interval`` or
+    sooner when a full batch is waiting.
+    """
+
+    def __init__(self, sinks: Sequence, capacity: int = 65536, batch_size: int = 4096,
+                 flush_interval: float = 0.5):
+        self.sinks = list(sinks)
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.errors = 0
+        self._queue: Deque[GameEvent] = deque()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="event-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def emit(self, game_id: int, tick: int, kind: int, x: int = -1, y: int = -1, value: int = 0):
+        queue = self._queue
+        if len(queue) >= self.capacity:
+            self.dropped += 1
+            return
+        queue.append(GameEvent(time.time(), game_id, tick, kind, x, y, value))
+        if len(queue) == self.batch_size:
+            self._wake.set()
+
+    def flush(self):
+        """Write out everything queued so far"""
+        queue = self._queue
+        with self._write_lock:
+            while queue:
+                batch: List[GameEvent] = []
+                for _ in range(min(len(queue), self.batch_size)):
+                    batch.append(queue.popleft())
+                for sink in self.sinks:
+                    try:
+                        sink.write(batch)
+                    except Exception:
+                        # Drop this batch for this sink; keep the others (and the writer thread) going
+                        self.errors += 1
+                        logger.exception("event sink %r failed to write a batch", sink)
+            for sink in self.sinks:
+                try:
+                    sink.flush()
+                except Exception:
+                    self.errors += 1
+                    logger.exception("event sink %r failed to flush", sink)
+
+    def _write_loop(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """Write outstanding events and close every sink"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join()
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+
+_default_bus: Optional[EventBus] = None
+_default_bus_lock = threading.Lock()
+
+
+def get_default_bus() -> Optional[EventBus]:
+    """Process-wide event bus writing to SNAKE_EVENT_LOG, or None when logging is off"""
+    global _default_bus
+    if EVENT_LOG is None:
+        return None
+    with _default_bus_lock:
+        if _default_bus is None:
+            sink_class = JsonLinesSink if EVENT_LOG.endswith(".jsonl") else BinarySink
+            _default_bus = EventBus([sink_class(EVENT_LOG, max_bytes=EVENT_LOG_MAX_BYTES)])
+        return _default_bus
@@ -0,0 +1,317 @@
+import itertools
+import os
+import random
+import struct
+from collections import deque
+from itertools import islice
+from operator import sub
+from typing import TYPE_CHECKING, Deque, List, Optional, Tuple
+
+from .body import SnakeBody
+from .events import FOOD as FOOD_EATEN, GAME_OVER, PAUSE, TICK, TURN
+from .grid import BoardGrid, EMPTY, BODY, HEAD, FOOD
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Direction vectors as (dx, dy); list order gives the 2-bit codes used by the
+# batch engine and replays, and the opposite of DIRECTIONS[i] is DIRECTIONS[(i + 2) % 4]
+UP = (0, -1)
+RIGHT = (1, 0)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+DIRECTIONS = [UP, RIGHT, DOWN, LEFT]
+
+# Ids for played games, unique within the process (a new one on every reset)
+_game_ids = itertools.count(1)
+
+# Turns that can wait for their tick; presses beyond this are dropped
+INPUT_QUEUE_SIZE = 3
+
+# Snapshot layout (little-endian): magic, version, grid_size, flags, direction,
+# queued turns, score, high_score, tick, food cell (-1 for none), length, head
+# cell, RNG words drawn, seed length; then the seed, and the body as 2-bit moves
+# from head to tail followed by the queued turns as 2-bit direction codes
+SNAPSHOT_MAGIC = b"SNKS"
+SNAPSHOT_VERSION = 2
+SNAPSHOT = struct.Struct("<4sBHBBBIIIiIIIB")
+_STARTED, _OVER, _PAUSED = 1, 2, 4
+
+
+class _CountingRandom(random.Random):
+    """random.Random that remembers its seed and counts the 32-bit words drawn
+    since, so its state can be saved as (seed, words) instead of the 2.5 KB
+    Mersenne Twister state and restored by seeding and skipping ahead"""
+
+    def seed(self, a=None, version=2):
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "little")
+        self.seed_value = abs(a)  # random.seed ignores the sign of an int
+        self.words = 0
+        super().seed(self.seed_value, version)
+
+    def getrandbits(self, k: int) -> int:
+        self.words += (k + 31) >> 5
+        return super().getrandbits(k)
+
+    def random(self) -> float:
+        self.words += 2
+        return super().random()
+
+    def getstate(self):
+        return super().getstate(), self.seed_value, self.words
+
+    def setstate(self, state):
+        state, self.seed_value, self.words = state
+        super().setstate(state)
+
+    def skip(self, words: int):
+        """Advance as if `words` 32-bit words had been drawn"""
+        if words:
+            self.getrandbits(32 * words)
+
+
+class SnakeGame:
+    """Snake rules shared by every front-end: wrap-around walls, no 180-degree
+    turns, +10 per food, game over on hitting yourself, win on a full grid.
+
+    Pure Python with no Streamlit or NumPy import, so it loads in
+    milliseconds and runs headless. High scores go to an optional
+    ``score_store`` (anything with ``best(grid_size)`` and
+    ``submit(grid_size, score)``, e.g. ScoreStore); without one they are
+    only kept on the instance. Likewise, ticks, turns, food, pauses and
+    game over are reported to an optional ``events`` bus (anything with
+    ``emit(game_id, tick, kind, x, y, value)``, e.g. EventBus).
+
+    Turns wait in a small queue and are applied one per tick, so several
+    presses between two ticks are all played, in order, and can never add
+    up to a 180-degree turn.
+
+    ``to_bytes``/``from_bytes`` save and restore a game in a few hundred
+    bytes, so it can live in an external cache and move between workers.
+    """
+    
+    __slots__ = ("grid_size", "score_store", "events", "rng", "board", "snake", "food", "direction", "inputs",
+                 "score", "game_over", "game_started", "paused", "high_score", "game_id", "tick")
+    
+    def __init__(self, grid_size: int = 20, seed: Optional[int] = None, score_store=None, events=None):
+        self.grid_size = grid_size
+        self.score_store = score_store
+        self.events = events
+        self.rng = _CountingRandom(seed)  # Per-game RNG so food placement is reproducible
+        self.board = BoardGrid(grid_size)
+        self.snake = SnakeBody(grid_size)
+        self.food = None
+        self.reset_game()
+    
+    def reset_game(self, seed: Optional[int] = None):
+        """Reset the game to initial state (reseeding the food RNG if a seed is given)"""
+        if seed is not None:
+            self.rng.seed(seed)
+        
+        # Clear the previous game off the board so the change set is a valid delta
+        self.board.clear_changes()
+        for segment in self.snake:
+            self.board.set(segment, EMPTY)
+        if self.food is not None:
+            self.board.set(self.food, EMPTY)
+        
+        center = self.grid_size // 2
+        self.snake = SnakeBody(self.grid_size, [(center, center)])  # Start at center
+        self.board.set(self.snake.head, HEAD)
+        self.direction = (1, 0)  # Start moving right
+        self.inputs: Deque[Tuple[int, int]] = deque()  # Queued turns, oldest first
+        self.food = self.generate_food()
+        if self.food is not None:
+            self.board.set(self.food, FOOD)
+        self.score = 0
+        self.game_over = False
+        self.game_started = False
+        self.paused = False
+        self.high_score = self.load_high_score()
+        self.game_id = next(_game_ids)
+        self.tick = 0  # Moves made this game
+    
+    def load_high_score(self) -> int:
+        """Load the best score for this grid size from the leaderboard"""
+        if self.score_store is None:
+            return 0
+        return self.score_store.best(self.grid_size)
+    
+    def save_high_score(self):
+        """Submit the finished game's score to the leaderboard"""
+        if self.score_store is not None and self.score > 0:
+            self.score_store.submit(self.grid_size, self.score)
+        self.high_score = max(self.high_score, self.score)
+    
+    def generate_food(self) -> Optional[Tuple[int, int]]:
+        """Generate food at random position, avoiding snake body"""
+        # Depends only on the RNG and the covered cells; None once the snake fills the grid
+        return self.snake.random_free_cell(self.rng)
+    
+    def move_snake(self):
+        """Move the snake in current direction"""
+        self.board.clear_changes()
+        if self.game_over or not self.game_started or self.paused:
+            return
+        self.tick += 1
+        
+        # Apply the next queued turn (already checked against the direction before it)
+        if self.inputs:
+            self.direction = self.inputs.popleft()
+            if self.events is not None:
+                head = self.snake.head
+                self.events.emit(self.game_id, self.tick, TURN, head[0], head[1], DIRECTIONS.index(self.direction))
+        
+        # Calculate new head position
+        head_x, head_y = self.snake.head
+        new_head = (
+            (head_x + self.direction[0]) % self.grid_size,
+            (head_y + self.direction[1]) % self.grid_size
+        )
+        
+        # Check collision with self (O(1) occupancy lookup)
+        if new_head in self.snake:
+            self.game_over = True
+            self.save_high_score()
+            if self.events is not None:
+                self.events.emit(self.game_id, self.tick, GAME_OVER, new_head[0], new_head[1], self.score)
+            return
+        
+        # Add new head
+        self.board.set(self.snake.head, BODY)
+        self.snake.push_head(new_head)
+        self.board.set(new_head, HEAD)
+        
+        # Check if food is eaten
+        if new_head == self.food:
+            self.score += 10
+            if self.events is not None:
+                self.events.emit(self.game_id, self.tick, FOOD_EATEN, new_head[0], new_head[1], self.score)
+            self.food = self.generate_food()
+            if self.food is not None:
+                self.board.set(self.food, FOOD)
+            # Check if snake fills entire grid (win condition)
+            if len(self.snake) >= self.grid_size * self.grid_size:
+                self.game_over = True
+                self.save_high_score()
+        else:
+            # Remove tail if no food eaten
+            self.board.set(self.snake.pop_tail(), EMPTY)
+        
+        if self.events is not None:
+            self.events.emit(self.game_id, self.tick, TICK, new_head[0], new_head[1], len(self.snake))
+            if self.game_over:
+                self.events.emit(self.game_id, self.tick, GAME_OVER, new_head[0], new_head[1], self.score)
+    
+    def change_direction(self, new_direction: Tuple[int, int]):
+        """Queue a turn for the next free tick (ignoring no-op and 180-degree turns)"""
+        if not self.game_over and self.game_started and not self.paused:
+            # Checked against the last queued turn, i.e. the direction it will follow
+            last = self.inputs[-1] if self.inputs else self.direction
+            if new_direction == last or (new_direction[0] == -last[0] and new_direction[1] == -last[1]):
+                return
+            if len(self.inputs) < INPUT_QUEUE_SIZE:
+                self.inputs.append(new_direction)
+    
+    def toggle_pause(self):
+        """Toggle game pause state"""
+        if self.game_started and not self.game_over:
+            self.paused = not self.paused
+            if self.events is not None:
+                head = self.snake.head
+                self.events.emit(self.game_id, self.tick, PAUSE, head[0], head[1], int(self.paused))
+    
+    def get_grid_state(self) -> "np.ndarray":
+        """Get current grid state for visualization (read-only, updated in place each tick)"""
+        return self.board.array
+    
+    def get_grid_changes(self) -> List[Tuple[int, int, int]]:
+        """Cells changed by the last tick or reset, as (x, y, value)"""
+        return self.board.get_changes()
+    
+    def to_bytes(self) -> bytes:
+        """Compact snapshot of the game (under 300 bytes on a full 30x30 board).
+
+        The body is stored as its head cell plus a 2-bit move per segment,
+        queued turns as 2-bit codes, and the RNG as its seed and the number
+        of words drawn. The score store and event bus are not part of the
+        snapshot.
+        """
+        n = self.grid_size
+        segments = self.snake.segments
+        # Direction code of each move, keyed by the change in cell index (with and without a wrap)
+        move_code = {-n: 0, n * (n - 1): 0, 1: 1, 1 - n: 1, n: 2, n * (1 - n): 2, -1: 3, n - 1: 3}
+        indices = [y * n + x for x, y in segments]
+        codes = bytes(map(move_code.__getitem__, map(sub, islice(indices, 1, None), indices))) \
+            + bytes([DIRECTIONS.index(direction) for direction in self.inputs])
+        flags = (_STARTED if self.game_started else 0) | (_OVER if self.game_over else 0) \
+            | (_PAUSED if self.paused else 0)
+        food = -1 if self.food is None else self.food[1] * n + self.food[0]
+        seed = self.rng.seed_value.to_bytes((self.rng.seed_value.bit_length() + 7) // 8, "little")
+        head = self.snake.head
+        header = SNAPSHOT.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, n, flags, DIRECTIONS.index(self.direction),
+                               len(self.inputs), self.score, self.high_score, self.tick, food, len(segments),
+                               head[1] * n + head[0], self.rng.words, len(seed))
+        return header + seed + _pack_codes(codes)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes, score_store=None, events=None) -> "SnakeGame":
+        """Game restored from to_bytes, with a new game_id.
+
+        Food spawns draw from the saved RNG state over the same covered
+        cells, so the restored game places the same food as the original.
+        """
+        (magic, version, n, flags, direction, queued, score, high_score, tick, food, length, head,
+         words, seed_length) = SNAPSHOT.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"not a version {SNAPSHOT_VERSION} snake snapshot")
+        offset = SNAPSHOT.size + seed_length
+        seed = int.from_bytes(data[SNAPSHOT.size:offset], "little")
+        codes = _unpack_codes(data[offset:], length - 1 + queued)
+
+        game = cls.__new__(cls)
+        game.grid_size = n
+        game.score_store = score_store
+        game.events = events
+        game.rng = _CountingRandom(seed)
+        game.rng.skip(words)
+        game.snake = SnakeBody.from_moves(n, head, codes[:length - 1])
+        game.board = BoardGrid(n)
+        game.board.cells[:] = game.snake.occupied  # BODY == 1
+        game.board.cells[head] = HEAD
+        game.food = None if food < 0 else (food % n, food // n)
+        if food >= 0:
+            game.board.cells[food] = FOOD
+        game.direction = DIRECTIONS[direction]
+        game.inputs = deque([DIRECTIONS[code] for code in codes[length - 1:]])
+        game.score = score
+        game.high_score = high_score
+        game.tick = tick
+        game.game_started = bool(flags & _STARTED)
+        game.game_over = bool(flags & _OVER)
+        game.paused = bool(flags & _PAUSED)
+        game.game_id = next(_game_ids)
+        return game
+
+
+def _pack_codes(codes: bytes) -> bytes:
+    """Pack 2-bit codes (one per byte) four to a byte, first code in the low bits.
+    Each quarter of the codes is shifted into place with one big-int operation."""
+    count = (len(codes) + 3) // 4
+    codes = codes.ljust(4 * count, b"\0")
+    packed = 0
+    for shift in range(4):
+        packed |= int.from_bytes(codes[shift::4], "little") << (2 * shift)
+    return packed.to_bytes(count, "little")
+
+
+def _unpack_codes(data: bytes, count: int) -> bytes:
+    """Inverse of _pack_codes: `count` codes, one per byte"""
+    size = (count + 3) // 4
+    packed = int.from_bytes(data[:size], "little")
+    mask = int.from_bytes(b"\3" * size, "little")
+    codes = bytearray(4 * size)
+    for shift in range(4):
+        codes[shift::4] = ((packed >> (2 * shift)) & mask).to_bytes(size, "little")
+    return bytes(codes[:count])
@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Cell = Tuple[int, int]
+
+# Cell values used by get_grid_state and the renderers
+EMPTY = 0
+BODY = 1
+HEAD = 2
+FOOD = 3
+
+# Side of the square chunks the board is divided into for dirty tracking
+CHUNK_SIZE = 32
+
+
+class BoardGrid:
+    """Persistent uint8 board that the engine updates cell by cell.
+
+    ``cells`` is a flat bytearray (cheap scalar writes) and ``array`` is a
+    read-only, zero-copy (grid_size, grid_size) NumPy view of it indexed as
+    [y, x], created on first use so the engine does not need NumPy to run.
+    Every write is also recorded in ``changes`` so front-ends can apply a
+    per-tick delta instead of redrawing the full board.
+
+    For large boards, each write also marks its CHUNK_SIZE x CHUNK_SIZE
+    chunk in ``dirty_chunks`` (chunk index = chunk row * chunks_per_row +
+    chunk column) until a consumer takes them with take_dirty_chunks, so a
+    minimap or similar summary only recomputes what changed, however many
+    ticks passed in between. The cells themselves stay one flat array:
+    a row of any window is at most two slices of it.
+    """
+
+    __slots__ = ("grid_size", "cells", "changes", "chunks_per_row", "dirty_chunks", "_array")
+
+    def __init__(self, grid_size: int):
+        self.grid_size = grid_size
+        self.cells = bytearray(grid_size * grid_size)
+        self.changes: Dict[Cell, int] = {}
+        self.chunks_per_row = -(-grid_size // CHUNK_SIZE)
+        self.dirty_chunks: Set[int] = set()
+        self._array = None
+
+    @property
+    def array(self) -> "np.ndarray":
+        if self._array is None:
+            import numpy as np
+            self._array = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.grid_size, self.grid_size)
+            self._array.flags.writeable = False  # Only the engine writes cells, through set()
+        return self._array
+
+    def set(self, cell: Cell, value: int):
+        """Write a cell value and record it as changed"""
+        x, y = cell
+        self.cells[y * self.grid_size + x] = value
+        self.changes[cell] = value
+        self.dirty_chunks.add(y // CHUNK_SIZE * self.chunks_per_row + x // CHUNK_SIZE)
+
+    def clear_changes(self):
+        """Start a new tick with an empty change set"""
+        self.changes.clear()
+
+    def take_dirty_chunks(self) -> Set[int]:
+        """Chunks written since the last call, leaving none marked"""
+        dirty, self.dirty_chunks = self.dirty_chunks, set()
+        return dirty
+
+    def get_changes(self) -> List[Tuple[int, int, int]]:
+        """Cells written since the last clear_changes, as (x, y, value)"""
+        return [(x, y, value) for (x, y), value in self.changes.items()]
@@ -0,0 +1,109 @@
+import os
+from array import array
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from .game import DIRECTIONS, SnakeGame
+
+# Precomputed cycles, one file per grid size (override with SNAKE_CACHE_DIR)
+CACHE_DIR = os.environ.get("SNAKE_CACHE_DIR",
+                           os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache"))
+
+
+def build_cycle(grid_size: int) -> array:
+    """Position along a Hamiltonian cycle of the wrapped grid for every cell
+    (indexed y * grid_size + x).
+
+    Row y is walked left to right starting at x = -y (mod n), so each row
+    ends directly above where the next one starts, and the last row ends
+    at (0, n - 1), which wraps back onto (0, 0). This works for every
+    grid size, odd ones included, because the walls wrap.
+    """
+    n = grid_size
+    positions = array("i", bytes(4 * n * n))
+    for y in range(n):
+        for i in range(n):
+            positions[y * n + (i - y) % n] = y * n + i
+    return positions
+
+
+@lru_cache(maxsize=16)
+def cycle_positions(grid_size: int) -> array:
+    """build_cycle, loaded from the on-disk cache when present and written to it when not"""
+    cells = grid_size * grid_size
+    path = os.path.join(CACHE_DIR, f"hamiltonian-{grid_size}.bin")
+    try:
+        positions = array("i")
+        with open(path, "rb") as f:
+            positions.fromfile(f, cells)
+        return positions
+    except (OSError, EOFError):
+        pass
+
+    positions = build_cycle(grid_size)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            positions.tofile(f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Read-only or full disk: keep it in memory only
+    return positions
+
+
+class HamiltonianSolver:
+    """Plays a SnakeGame to a full-grid win by following a Hamiltonian cycle,
+    taking shortcuts while they are safe.
+
+    Following the cycle alone can never fail, but it needs about half the
+    grid's cells in steps per food. While the snake is short it may instead
+    jump ahead along the cycle to a neighbouring cell, as long as it lands
+    before the food and well before its own tail. That keeps the body in
+    cycle order behind the head, with enough free cells ahead to keep
+    growing. Shortcuts stop once the snake covers half the grid. Each
+    decision is four table lookups.
+    """
+
+    def __init__(self, grid_size: int, shortcuts: bool = True):
+        self.grid_size = grid_size
+        self.shortcuts = shortcuts  # False follows the bare cycle (baseline)
+        self.positions = cycle_positions(grid_size)
+
+    def next_direction(self, game: SnakeGame) -> Optional[Tuple[int, int]]:
+        """Direction for the coming tick"""
+        n = self.grid_size
+        cells = n * n
+        positions = self.positions
+        head_x, head_y = game.snake.head
+        head = positions[head_y * n + head_x]
+        length = len(game.snake)
+
+        tail_x, tail_y = game.snake.tail
+        to_tail = (positions[tail_y * n + tail_x] - head) % cells or cells
+        to_food = cells
+        if game.food is not None:
+            to_food = (positions[game.food[1] * n + game.food[0]] - head) % cells
+
+        # How far along the cycle a shortcut may jump
+        if not self.shortcuts or cells - length < cells // 2:
+            budget = 0
+        else:
+            budget = to_tail - length - 3
+            if to_food < to_tail:
+                budget -= 1  # Eating will not move the tail this tick
+                if (to_tail - to_food) * 4 > cells - length:
+                    budget -= 10
+        budget = min(budget, to_food)
+
+        best_direction, best = None, 0
+        for direction in DIRECTIONS:
+            cell = ((head_x + direction[0]) % n, (head_y + direction[1]) % n)
+            if cell in game.snake:
+                continue
+            ahead = (positions[cell[1] * n + cell[0]] - head) % cells
+            if ahead == 1 and best == 0:
+                best_direction = direction  # The next cell of the cycle is always safe
+            elif 1 < ahead <= budget and ahead > best:
+                best_direction, best = direction, ahead
+        return best_direction
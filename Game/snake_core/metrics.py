@@ -0,0 +1,119 @@
+import logging
+import os
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+# Phases timed on every tick, in the order they happen
+PHASES = ("move", "grid", "render", "emit", "script", "interval", "drift")
+
+PHASE_HELP = {
+    "move": "move_snake",
+    "grid": "get_grid_state",
+    "render": "board markup build",
+    "emit": "st.markdown of the board",
+    "script": "script run up to the tick sleep",
+    "interval": "actual time between frames",
+    "drift": "how late the tick ran past its deadline",
+}
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Prometheus text-format file for a node_exporter textfile collector (off when unset)
+METRICS_FILE = os.environ.get("SNAKE_METRICS_FILE")
+# The game server's own file, so it does not overwrite the apps' (defaults to snake-server.prom beside it)
+SERVER_METRICS_FILE = os.environ.get("SNAKE_SERVER_METRICS_FILE") or (
+    None if METRICS_FILE is None else os.path.join(os.path.dirname(METRICS_FILE), "snake-server.prom"))
+
+logger = logging.getLogger(__name__)
+
+
+class TickMetrics:
+    """Per-phase tick timings kept in fixed-size ring buffers.
+
+    Recording a sample is one array store and two integer/float updates, so
+    instrumentation can stay on in production; percentiles are only
+    computed when someone asks for them.
+    """
+
+    def __init__(self, capacity: int = 1024, export_path: Optional[str] = METRICS_FILE,
+                 export_interval: float = 5.0):
+        self.capacity = capacity
+        self.samples: Dict[str, array] = {phase: array("d", bytes(8 * capacity)) for phase in PHASES}
+        self.counts: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.totals: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.export_path = export_path
+        self.export_interval = export_interval
+        self.last_export = 0.0
+        self._export_lock = threading.Lock()
+
+    def record(self, phase: str, seconds: float):
+        count = self.counts[phase]
+        self.samples[phase][count % self.capacity] = seconds
+        self.counts[phase] = count + 1
+        self.totals[phase] += seconds
+
+    def lap(self, phase: str, start: float) -> float:
+        """Record the time since `start` under `phase` and return the current time"""
+        now = time.perf_counter()
+        self.record(phase, now - start)
+        return now
+
+    def record_frame(self, last_frame: Optional[float], lateness: float) -> float:
+        """Record the real interval since the previous frame and how late its tick ran; returns now"""
+        now = time.perf_counter()
+        if last_frame is not None:
+            self.record("interval", now - last_frame)
+        self.record("drift", lateness)
+        return now
+
+    def percentiles(self, phase: str) -> Optional[Tuple[float, ...]]:
+        """(p50, p95, p99) in seconds over the buffered window, None before any sample"""
+        count = min(self.counts[phase], self.capacity)
+        if count == 0:
+            return None
+        window = sorted(self.samples[phase][:count])
+        return tuple(window[min(count - 1, int(q * count))] for q in QUANTILES)
+
+    def prometheus_text(self) -> str:
+        """Every phase as a Prometheus summary"""
+        lines: List[str] = [
+            "# HELP snake_tick_phase_seconds Duration of each phase of a game tick",
+            "# TYPE snake_tick_phase_seconds summary",
+        ]
+        for phase in PHASES:
+            values = self.percentiles(phase)
+            if values is None:
+                continue
+            for quantile, value in zip(QUANTILES, values):
+                lines.append(f'snake_tick_phase_seconds{{phase="{phase}",quantile="{quantile}"}} {value:.9f}')
+            lines.append(f'snake_tick_phase_seconds_sum{{phase="{phase}"}} {self.totals[phase]:.9f}')
+            lines.append(f'snake_tick_phase_seconds_count{{phase="{phase}"}} {self.counts[phase]}')
+        return "\n".join(lines) + "\n"
+
+    def maybe_export(self):
+        """Rewrite the metrics file atomically, at most once per export_interval.
+
+        Sessions share one TickMetrics, so only the caller that claims the
+        interval exports, through a tmp file of its own; a failed write is
+        logged rather than raised into the tick.
+        """
+        if self.export_path is None:
+            return
+        now = time.monotonic()
+        with self._export_lock:
+            if now - self.last_export < self.export_interval:
+                return
+            self.last_export = now
+        tmp_path = f"{self.export_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(self.prometheus_text())
+            os.replace(tmp_path, self.export_path)
+        except OSError:
+            logger.exception("could not export tick metrics to %s", self.export_path)
+
+
+# Shared by every session in the process
+TICK_METRICS = TickMetrics()
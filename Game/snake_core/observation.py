@@ -0,0 +1,329 @@
+from typing import Optional
+
+import numpy as np
+
+from .game import DIRECTIONS
+from .grid import BODY, EMPTY, FOOD, HEAD
+
+# Feature planes of an observation, in channel order. Body covers every
+# segment including the head; the four direction planes are a one-hot of
+# the current direction (all ones in the plane that matches); distance is
+# the wrapped Manhattan distance from each cell to the food, 0 at the food
+# and 1 (255 for uint8) at the farthest cell, and all 0 once the grid is full
+CH_BODY, CH_HEAD, CH_FOOD, CH_UP, CH_RIGHT, CH_DOWN, CH_LEFT, CH_DISTANCE = range(8)
+CHANNEL_NAMES = ("body", "head", "food", "up", "right", "down", "left", "distance")
+NUM_CHANNELS = len(CHANNEL_NAMES)
+
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+
+def _axis_distance(grid_size: int) -> np.ndarray:
+    """Wrapped distance along one axis by offset, scaled so a full diagonal sums to 1"""
+    offset = np.arange(grid_size)
+    return (np.minimum(offset, grid_size - offset) / max(1, 2 * (grid_size // 2))).astype(np.float32)
+
+
+class ObservationEncoder:
+    """Writes per-tick feature planes for a SnakeGame or a BatchSnakeEnv
+    into a buffer the caller allocated once (``new_buffer`` or any array of
+    ``shape`` and ``dtype``, which is uint8 or float32).
+
+    With ``num_boards`` None it encodes one game into a (channels, size,
+    size) buffer; otherwise all boards of a BatchSnakeEnv into (num_boards,
+    channels, size, size). By default the planes cover the whole board.
+    With ``view`` they are a view x view window centred on the head, taken
+    from the wrapped board, so the head always sits at [view // 2, view // 2].
+
+    A step is a fixed handful of NumPy calls writing through ``out=``: the
+    planes are read straight off the board (the engine's bytearray for a
+    game, ``occupied`` for a batch), every intermediate lives in scratch
+    arrays sized at construction, and the output buffer's channel views
+    are kept while the same buffer comes back. No array is allocated per
+    step. A game is encoded with lookup tables and single-cell writes,
+    which is cheapest for one small board; a batch is encoded with
+    vectorised comparisons across all boards.
+    """
+
+    def __init__(self, grid_size: int, num_boards: Optional[int] = None, view: Optional[int] = None,
+                 dtype=np.float32):
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.uint8, np.float32):
+            raise ValueError(f"observations are uint8 or float32, not {self.dtype}")
+        n = grid_size
+        size = n if view is None else view
+        self.grid_size = grid_size
+        self.num_boards = num_boards
+        self.view = view
+        self.size = size
+        self.frame_shape = (NUM_CHANNELS, size, size)
+        self.shape = self.frame_shape if num_boards is None else (num_boards,) + self.frame_shape
+
+        self._source = None  # The board or batch the views below belong to
+        self._grid: Optional[np.ndarray] = None  # Cell values, (n, n) for a game or (boards, n, n) for a batch
+        self._flat: Optional[np.ndarray] = None  # The same, flattened
+        self._body: Optional[np.ndarray] = None  # A batch's body ring buffers, flattened
+        self._out = None  # The last output buffer and its channel views
+        self._out_views: tuple = ()
+
+        if num_boards is None:
+            self._init_game()
+        else:
+            self._init_batch()
+
+    def _init_game(self):
+        n, size = self.grid_size, self.size
+        # Body plane value per cell value
+        self._body_lut = np.zeros(4, dtype=self.dtype)
+        self._body_lut[[BODY, HEAD]] = 1
+        self._body_lut[[EMPTY, FOOD]] = 0
+        # Distance plane for every food offset: rows/columns i of the table are offset i % n, so the
+        # size x size block at ((top - food_y) % n, (left - food_x) % n) is the window's plane
+        axis = _axis_distance(n)[np.arange(n + size) % n]
+        table = axis[:, None] + axis[None, :]
+        if self.dtype == np.uint8:
+            table = np.rint(table * 255)
+        self._distance_table = table.astype(self.dtype)
+        if self.view is not None:
+            # Flat board cell of every window position, laid out like the distance table
+            wrapped = np.arange(n + size) % n
+            self._cell_table = wrapped[:, None] * n + wrapped[None, :]
+            self._window = np.zeros((size, size), dtype=np.uint8)
+
+    def _init_batch(self):
+        n, size, batch = self.grid_size, self.size, self.num_boards
+        # Per-board positions and state, loaded from the batch each step
+        self._head = np.zeros(batch, dtype=np.int64)  # Flat cell index
+        self._head_x = np.zeros(batch, dtype=np.int64)
+        self._head_y = np.zeros(batch, dtype=np.int64)
+        self._food = np.zeros(batch, dtype=np.int64)  # Flat cell index, -1 for none
+        self._food_x = np.zeros(batch, dtype=np.int64)
+        self._food_y = np.zeros(batch, dtype=np.int64)
+        self._has_food = np.zeros(batch, dtype=np.float32)
+        self._direction = np.zeros(batch, dtype=np.int64)
+        self._head_ptrs = np.zeros(batch, dtype=np.int64)
+        self._body_heads = np.zeros(batch, dtype=np.int32)  # np.take needs the source dtype
+        # Broadcasting views of the above, made once
+        self._head_at = self._head[:, None, None]
+        self._food_at = self._food[:, None, None]
+        self._has_food_at = self._has_food[:, None, None]
+        self._head_x_col, self._head_y_col = self._head_x[:, None], self._head_y[:, None]
+        self._food_x_col, self._food_y_col = self._food_x[:, None], self._food_y[:, None]
+        self._direction_col = self._direction[:, None]
+        self._board_starts = np.arange(batch) * n * n  # Offset of each board in the flat arrays
+        self._board_starts_at = self._board_starts[:, None, None]
+
+        # Board rows and columns each output row/column shows, and the flat cells they meet at
+        if self.view is None:
+            self._rows = np.broadcast_to(np.arange(n), (batch, n))
+            self._cols = self._rows
+            self._cells = np.broadcast_to(np.arange(n * n).reshape(n, n), (batch, n, n))
+        else:
+            self._offsets = np.arange(size) - size // 2
+            self._rows = np.zeros((batch, size), dtype=np.int64)
+            self._cols = np.zeros((batch, size), dtype=np.int64)
+            self._row_starts = np.zeros((batch, size), dtype=np.int64)
+            self._cells = np.zeros((batch, size, size), dtype=np.int64)
+            self._row_starts_col = self._row_starts[:, :, None]
+            self._cols_row = self._cols[:, None, :]
+            self._gather = np.zeros((batch, size, size), dtype=np.int64)
+            self._window = np.zeros((batch, size, size), dtype=np.uint8)
+
+        self._axis_distance = _axis_distance(n)
+        self._axis_delta = np.zeros((batch, size), dtype=np.int64)
+        self._row_distance = np.zeros((batch, size), dtype=np.float32)
+        self._col_distance = np.zeros((batch, size), dtype=np.float32)
+        self._row_distance_col = self._row_distance[:, :, None]
+        self._col_distance_row = self._col_distance[:, None, :]
+        self._distance = np.zeros((batch, size, size), dtype=np.float32)
+
+        self._shifted = np.zeros((batch, size, size), dtype=np.uint8)
+        self._mask = np.zeros((batch, size, size), dtype=bool)  # Comparisons land here, then copy over (no cast buffer)
+        self._one_hot = np.zeros((batch, len(DIRECTIONS)), dtype=bool)
+        self._one_hot_planes = self._one_hot[:, :, None, None]
+        self._codes = np.arange(len(DIRECTIONS))
+
+    def new_buffer(self) -> np.ndarray:
+        """A zeroed output buffer of the right shape and dtype"""
+        return np.zeros(self.shape, dtype=self.dtype)
+
+    def encode_game(self, game, out: np.ndarray) -> np.ndarray:
+        """Write the planes of one SnakeGame into out; returns out"""
+        if self.num_boards is not None:
+            raise ValueError("this encoder is for a batch; use encode_batch")
+        self._encode_game(game, self._bind(out))
+        return out
+
+    def encode_batch(self, env, out: np.ndarray) -> np.ndarray:
+        """Write the planes of every board of a BatchSnakeEnv into out; returns out"""
+        if self.num_boards is None:
+            raise ValueError("this encoder is for a single game; use encode_game")
+        self._encode_batch(env, self._bind(out))
+        return out
+
+    def _bind(self, out: np.ndarray) -> tuple:
+        """Channel views of an output buffer (reused while it stays the same buffer)"""
+        if out is self._out:
+            return self._out_views
+        if out.shape != self.shape or out.dtype != self.dtype:
+            raise ValueError(f"expected a {self.dtype} buffer of shape {self.shape}, got {out.dtype} {out.shape}")
+        planes = out if self.num_boards is not None else out[None]
+        self._out = out
+        self._out_views = (out[CH_BODY], out[CH_HEAD], out[CH_FOOD], out[CH_UP:CH_LEFT + 1], out[CH_DISTANCE]) \
+            if self.num_boards is None else \
+            (planes[:, CH_BODY], planes[:, CH_HEAD], planes[:, CH_FOOD], planes[:, CH_UP:CH_LEFT + 1],
+             planes[:, CH_DISTANCE])
+        return self._out_views
+
+    def _encode_game(self, game, views: tuple):
+        body, head, food, directions, distance = views
+        board = game.board
+        if board is not self._source:
+            self._source = board
+            self._grid, self._flat = board.array, board.array.reshape(-1)
+        n, size = self.grid_size, self.size
+        head_x, head_y = game.snake.head
+
+        # Indices are always in range; mode="clip" skips the temporary copy take makes under "raise"
+        if self.view is None:
+            top = left = 0
+            np.take(self._body_lut, self._grid, out=body, mode="clip")
+        else:
+            top, left = (head_y - size // 2) % n, (head_x - size // 2) % n
+            np.take(self._flat, self._cell_table[top:top + size, left:left + size], out=self._window, mode="clip")
+            np.take(self._body_lut, self._window, out=body, mode="clip")
+
+        head.fill(0)
+        self._mark(head, head_x, head_y, top, left)
+        food.fill(0)
+        if game.food is None:
+            distance.fill(0)
+        else:
+            food_x, food_y = game.food
+            self._mark(food, food_x, food_y, top, left)
+            row, col = (top - food_y) % n, (left - food_x) % n
+            np.copyto(distance, self._distance_table[row:row + size, col:col + size])
+        directions.fill(0)
+        directions[DIRECTION_CODES[game.direction]].fill(1)
+
+    def _mark(self, plane: np.ndarray, x: int, y: int, top: int, left: int):
+        """Set the window cells showing board cell (x, y) (more than one when the window is wider than the board)"""
+        n, size = self.grid_size, self.size
+        for row in range((y - top) % n, size, n):
+            for col in range((x - left) % n, size, n):
+                plane[row, col] = 1
+
+    def _encode_batch(self, env, views: tuple):
+        body, head, food, directions, distance = views
+        if env is not self._source:
+            self._source = env
+            self._grid = env.occupied.reshape(self.num_boards, env.grid_size, env.grid_size)
+            self._flat = env.occupied.reshape(-1)
+            self._body = env.body.reshape(-1)
+        n = self.grid_size
+        rows, cols, cells = self._rows, self._cols, self._cells
+
+        # Load heads, food and directions (indices are always in range, see _encode_game)
+        np.add(self._board_starts, env.head_ptr, out=self._head_ptrs)
+        np.take(self._body, self._head_ptrs, out=self._body_heads, mode="clip")
+        np.copyto(self._head, self._body_heads)
+        np.floor_divide(self._head, n, out=self._head_y)
+        np.remainder(self._head, n, out=self._head_x)
+        np.copyto(self._food, env.food)
+        np.floor_divide(self._food, n, out=self._food_y)
+        np.remainder(self._food, n, out=self._food_x)
+        np.greater_equal(self._food, 0, out=self._has_food)
+        np.copyto(self._direction, env.direction)
+
+        grid = self._grid
+        if self.view is not None:
+            # Window on the head: gather the wrapped rows and columns around it
+            np.add(self._head_y_col, self._offsets, out=rows)
+            np.remainder(rows, n, out=rows)
+            np.add(self._head_x_col, self._offsets, out=cols)
+            np.remainder(cols, n, out=cols)
+            np.multiply(rows, n, out=self._row_starts)
+            np.add(self._row_starts_col, self._cols_row, out=cells)
+            np.add(cells, self._board_starts_at, out=self._gather)
+            np.take(self._flat, self._gather, out=self._window, mode="clip")
+            grid = self._window
+
+        mask = self._mask
+        np.copyto(body, grid)  # occupied is 0/1
+        np.equal(cells, self._head_at, out=mask)
+        np.copyto(head, mask)
+        np.equal(cells, self._food_at, out=mask)
+        np.copyto(food, mask)
+        np.equal(self._direction_col, self._codes, out=self._one_hot)
+        np.copyto(directions, self._one_hot_planes)
+
+        np.subtract(rows, self._food_y_col, out=self._axis_delta)
+        np.remainder(self._axis_delta, n, out=self._axis_delta)
+        np.take(self._axis_distance, self._axis_delta, out=self._row_distance, mode="clip")
+        np.subtract(cols, self._food_x_col, out=self._axis_delta)
+        np.remainder(self._axis_delta, n, out=self._axis_delta)
+        np.take(self._axis_distance, self._axis_delta, out=self._col_distance, mode="clip")
+        if self.dtype == np.float32:
+            np.add(self._row_distance_col, self._col_distance_row, out=distance)
+            np.multiply(distance, self._has_food_at, out=distance)
+        else:
+            np.add(self._row_distance_col, self._col_distance_row, out=self._distance)
+            np.multiply(self._distance, self._has_food_at, out=self._distance)
+            np.multiply(self._distance, 255, out=self._distance)
+            np.rint(self._distance, out=self._distance)
+            np.copyto(distance, self._distance, casting="unsafe")
+
+
+class FrameStack:
+    """The last ``depth`` observations of an encoder, kept in a ring buffer.
+
+    ``push_game``/``push_batch`` encode the newest frame over the oldest
+    slot of ``frames`` (shape (depth, ...) for a single game, (num_boards,
+    depth, ...) for a batch), so nothing is shifted or reallocated. Slot
+    ``next`` is the oldest frame. ``read`` copies the frames into a caller
+    buffer of ``frames.shape`` oldest first. Frames not yet pushed are
+    zeros.
+    """
+
+    def __init__(self, encoder: ObservationEncoder, depth: int):
+        self.encoder = encoder
+        self.depth = depth
+        self._axis = 0 if encoder.num_boards is None else 1
+        if encoder.num_boards is None:
+            self.frames = np.zeros((depth,) + encoder.frame_shape, dtype=encoder.dtype)
+            self._slots = [self.frames[slot] for slot in range(depth)]
+        else:
+            self.frames = np.zeros((encoder.num_boards, depth) + encoder.frame_shape, dtype=encoder.dtype)
+            self._slots = [self.frames[:, slot] for slot in range(depth)]
+        self._slot_views = [encoder._bind(slot) for slot in self._slots]  # Channel views, so pushes rebind nothing
+        # Slot order oldest first, for each value of next
+        self._orders = [np.array([(start + k) % depth for k in range(depth)]) for start in range(depth)]
+        self.next = 0
+
+    def push_game(self, game) -> np.ndarray:
+        """Encode a SnakeGame as the newest frame; returns its slot"""
+        if self.encoder.num_boards is not None:
+            raise ValueError("this stack is for a batch; use push_batch")
+        slot = self.next
+        self.encoder._encode_game(game, self._slot_views[slot])
+        self.next = (slot + 1) % self.depth
+        return self._slots[slot]
+
+    def push_batch(self, env) -> np.ndarray:
+        """Encode every board of a BatchSnakeEnv as the newest frame; returns its slot"""
+        if self.encoder.num_boards is None:
+            raise ValueError("this stack is for a single game; use push_game")
+        slot = self.next
+        self.encoder._encode_batch(env, self._slot_views[slot])
+        self.next = (slot + 1) % self.depth
+        return self._slots[slot]
+
+    def read(self, out: np.ndarray) -> np.ndarray:
+        """Copy the stack into out, oldest frame first; returns out"""
+        return np.take(self.frames, self._orders[self.next], axis=self._axis, out=out, mode="clip")
+
+    def clear(self, mask: Optional[np.ndarray] = None):
+        """Zero every frame, or only those of the boards selected by a boolean mask (after a reset)"""
+        if mask is None:
+            self.frames.fill(0)
+        else:
+            self.frames[mask] = 0
@@ -0,0 +1,302 @@
+"""
+Snake Replays
+Compact binary recordings of finished games: the food seed, the grid size
+and the direction used on every tick packed at 2 bits per tick, plus a small
+keyframe of the snake every `keyframe_interval` ticks for fast seeking.
+
+File layout (little-endian):
+    header     magic "SNKR", version, grid_size, seed, keyframe_interval
+    blocks     keyframe (tick, food, direction, length, head cell, body as
+               2-bit moves from head to tail), the packed inputs of up to
+               keyframe_interval ticks, then the food cells spawned during
+               those ticks
+    footer     block offsets, block count, total ticks, final score, final
+               length, game_over flag, magic "SNKE"
+
+Food placement depends on the RNG state, which a keyframe does not capture,
+so each block carries its own food spawns; seeking never needs the RNG, and
+the verifier checks them against the seed.
+
+Usage: python -m snake_core.replay verify replays/*.snkr
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .body import SnakeBody
+from .game import DIRECTIONS, SnakeGame
+from .grid import BoardGrid, BODY, HEAD, FOOD
+
+MAGIC = b"SNKR"
+END_MAGIC = b"SNKE"
+VERSION = 1
+HEADER = struct.Struct("<4sBHQH")
+KEYFRAME = struct.Struct("<IiBII")
+FOOTER = struct.Struct("<IIIIB4s")
+OFFSET = struct.Struct("<I")
+COUNT = struct.Struct("<H")
+CELL = struct.Struct("<i")
+
+# Where the apps save their recordings (Game/replays by default)
+REPLAY_DIR = os.environ.get("SNAKE_REPLAY_DIR",
+                            os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "replays"))
+
+_END = object()
+
+DIRECTION_INDEX = {direction: index for index, direction in enumerate(DIRECTIONS)}
+
+
+def _step_index(grid_size: int, src: Tuple[int, int], dst: Tuple[int, int]) -> int:
+    """2-bit code of the wrap-around step from one cell to its neighbour"""
+    dx = (dst[0] - src[0]) % grid_size
+    dy = (dst[1] - src[1]) % grid_size
+    if dy == 0:
+        return DIRECTION_INDEX[(1, 0)] if dx == 1 else DIRECTION_INDEX[(-1, 0)]
+    return DIRECTION_INDEX[(0, 1)] if dy == 1 else DIRECTION_INDEX[(0, -1)]
+
+
+def _pack(codes: List[int]) -> bytes:
+    """Pack 2-bit codes four to a byte, first code in the low bits"""
+    packed = bytearray((len(codes) + 3) // 4)
+    for i, code in enumerate(codes):
+        packed[i >> 2] |= code << ((i & 3) << 1)
+    return bytes(packed)
+
+
+def _unpack(data, count: int) -> List[int]:
+    return [(data[i >> 2] >> ((i & 3) << 1)) & 3 for i in range(count)]
+
+
+def _encode_keyframe(game, tick: int) -> bytes:
+    cells = list(game.snake)
+    size = game.grid_size
+    moves = [_step_index(size, cells[i], cells[i + 1]) for i in range(len(cells) - 1)]
+    food = _cell_index(size, game.food)
+    head = cells[0][1] * size + cells[0][0]
+    return KEYFRAME.pack(tick, food, DIRECTION_INDEX[game.direction], len(cells), head) + _pack(moves)
+
+
+class Block(NamedTuple):
+    tick: int
+    food: Optional[Tuple[int, int]]
+    direction: Tuple[int, int]
+    cells: List[Tuple[int, int]]
+    inputs: List[int]
+    foods: List[Optional[Tuple[int, int]]]
+
+
+def _cell_index(grid_size: int, cell: Optional[Tuple[int, int]]) -> int:
+    return -1 if cell is None else cell[1] * grid_size + cell[0]
+
+
+def _cell(grid_size: int, index: int) -> Optional[Tuple[int, int]]:
+    return None if index < 0 else (index % grid_size, index // grid_size)
+
+
+class _ScriptedFoodGame(SnakeGame):
+    """Re-simulation game that takes its food spawns from the replay instead of the RNG"""
+
+    scripted_foods: Optional[Iterator] = None
+
+    def generate_food(self):
+        if self.scripted_foods is None:
+            return super().generate_food()
+        return next(self.scripted_foods)
+
+
+class ReplayWriter:
+    """Streams one game to disk; call record() after every tick that moved the snake"""
+
+    def __init__(self, path: str, game, seed: int, keyframe_interval: int = 256):
+        self.file = open(path, "wb")
+        self.keyframe_interval = keyframe_interval
+        self.offsets: List[int] = []
+        self.codes: List[int] = []
+        self.foods: List[int] = []
+        self.length = len(game.snake)
+        self.ticks = 0
+        self.file.write(HEADER.pack(MAGIC, VERSION, game.grid_size, seed, keyframe_interval))
+        self._write_keyframe(game)
+
+    def _write_keyframe(self, game):
+        self.offsets.append(self.file.tell())
+        self.file.write(_encode_keyframe(game, self.ticks))
+
+    def _flush_block(self):
+        self.file.write(_pack(self.codes))
+        self.file.write(COUNT.pack(len(self.foods)))
+        self.file.write(b"".join(CELL.pack(food) for food in self.foods))
+        self.codes = []
+        self.foods = []
+
+    def record(self, game):
+        """Record the direction used by the tick that just ran (and any food it spawned)"""
+        self.codes.append(DIRECTION_INDEX[game.direction])
+        self.ticks += 1
+        if len(game.snake) > self.length:
+            self.length = len(game.snake)
+            self.foods.append(_cell_index(game.grid_size, game.food))
+        if self.ticks % self.keyframe_interval == 0 and not game.game_over:
+            self._flush_block()
+            self._write_keyframe(game)
+
+    def close(self, game):
+        """Write the final result and the seek index"""
+        if self.file.closed:
+            return
+        self._flush_block()
+        for offset in self.offsets:
+            self.file.write(OFFSET.pack(offset))
+        self.file.write(FOOTER.pack(len(self.offsets), self.ticks, game.score, len(game.snake),
+                                    game.game_over, END_MAGIC))
+        self.file.close()
+
+
+def open_replay(game, seed: int, directory: str = REPLAY_DIR) -> ReplayWriter:
+    """Start recording a freshly reset game into a new file under `directory`"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{seed:016x}.snkr")
+    return ReplayWriter(path, game, seed)
+
+
+class ReplayReader:
+    """Memory-mapped view of a replay file with keyframe seeking"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.grid_size, self.seed, self.keyframe_interval = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} snake replay")
+        (num_blocks, self.ticks, self.score, self.length,
+         game_over, end_magic) = FOOTER.unpack_from(self.data, len(self.data) - FOOTER.size)
+        if end_magic != END_MAGIC:
+            raise ValueError(f"{path} is incomplete (no footer)")
+        self.game_over = bool(game_over)
+        index_start = len(self.data) - FOOTER.size - num_blocks * OFFSET.size
+        self.offsets = [OFFSET.unpack_from(self.data, index_start + i * OFFSET.size)[0]
+                        for i in range(num_blocks)]
+
+    def close(self):
+        self.data.close()
+
+    def block(self, block: int) -> Block:
+        """Decode one keyframe with its inputs and food spawns"""
+        offset = self.offsets[block]
+        tick, food, direction, length, head = KEYFRAME.unpack_from(self.data, offset)
+        offset += KEYFRAME.size
+        size = self.grid_size
+        cells = [_cell(size, head)]
+        for code in _unpack(self.data[offset:offset + (length + 2) // 4], length - 1):
+            dx, dy = DIRECTIONS[code]
+            x, y = cells[-1]
+            cells.append(((x + dx) % size, (y + dy) % size))
+        offset += (length + 2) // 4
+
+        count = min(self.keyframe_interval, self.ticks - block * self.keyframe_interval)
+        inputs = _unpack(self.data[offset:offset + (count + 3) // 4], count)
+        offset += (count + 3) // 4
+        (num_foods,) = COUNT.unpack_from(self.data, offset)
+        foods = [_cell(size, CELL.unpack_from(self.data, offset + COUNT.size + i * CELL.size)[0])
+                 for i in range(num_foods)]
+        return Block(tick, _cell(size, food), DIRECTIONS[direction], cells, inputs, foods)
+
+    def inputs(self) -> Iterator[int]:
+        """Direction codes of every tick"""
+        for block in range(len(self.offsets)):
+            yield from self.block(block).inputs
+
+    def state_at(self, tick: int) -> SnakeGame:
+        """Game after `tick` ticks, re-simulating at most one keyframe interval"""
+        if not 0 <= tick <= self.ticks:
+            raise IndexError(f"tick {tick} outside 0..{self.ticks}")
+        index = min(tick // self.keyframe_interval, len(self.offsets) - 1)
+        block = self.block(index)
+
+        game = _ScriptedFoodGame(self.grid_size, seed=self.seed)
+        game.snake = SnakeBody(self.grid_size, block.cells)
+        game.board = BoardGrid(self.grid_size)
+        for cell in block.cells[1:]:
+            game.board.set(cell, BODY)
+        game.board.set(block.cells[0], HEAD)
+        game.food = block.food
+        if game.food is not None:
+            game.board.set(game.food, FOOD)
+        game.board.clear_changes()
+        game.direction = block.direction
+        game.score = 10 * (len(block.cells) - 1)
+        game.game_started = True
+
+        game.scripted_foods = iter(block.foods)
+        for code in block.inputs[:tick - index * self.keyframe_interval]:
+            game.direction = DIRECTIONS[code]
+            game.move_snake()
+        game.scripted_foods = None
+        return game
+
+
+def verify_replay(path: str) -> bool:
+    """Replay a file through the engine and check every input, keyframe, food spawn and the result"""
+    try:
+        reader = ReplayReader(path)
+    except (OSError, ValueError, struct.error):
+        return False
+    try:
+        game = SnakeGame(reader.grid_size, seed=reader.seed)
+        game.game_started = True
+        for index in range(len(reader.offsets)):
+            block = reader.block(index)
+            if list(game.snake) != block.cells or game.food != block.food or game.direction != block.direction:
+                return False
+            foods = iter(block.foods)
+            for code in block.inputs:
+                if game.game_over:
+                    return False
+                # Inputs must be reachable through change_direction (no 180-degree turns)
+                game.change_direction(DIRECTIONS[code])
+                length = len(game.snake)
+                game.move_snake()
+                if game.direction != DIRECTIONS[code]:
+                    return False
+                if len(game.snake) > length and game.food != next(foods, _END):
+                    return False
+            if next(foods, _END) is not _END:
+                return False
+        return (game.score == reader.score and len(game.snake) == reader.length
+                and game.game_over == reader.game_over)
+    except (IndexError, KeyError, struct.error):
+        return False
+    finally:
+        reader.close()
+
+
+def verify_replays(paths: Iterable[str], workers: Optional[int] = None) -> Iterator[Tuple[str, bool]]:
+    """Verify many replays across a process pool, yielding (path, ok) in order"""
+    paths = list(paths)
+    if workers == 1:
+        yield from zip(paths, map(verify_replay, paths))
+        return
+    with Pool(workers) as pool:
+        yield from zip(paths, pool.imap(verify_replay, paths, chunksize=64))
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] != "verify":
+        print("Usage: python -m snake_core.replay verify REPLAY [REPLAY ...]")
+        sys.exit(2)
+    failed = 0
+    for path, ok in verify_replays(sys.argv[2:]):
+        if not ok:
+            failed += 1
+            print(f"❌ {path}")
+    print(f"{len(sys.argv) - 2 - failed} verified, {failed} failed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
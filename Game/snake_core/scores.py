@@ -0,0 +1,171 @@
+import atexit
+import contextlib
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Where the apps keep the leaderboard (Game/scores.db by default)
+SCORES_DB = os.environ.get("SNAKE_SCORES_DB",
+                           os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scores.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    grid_size INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    player TEXT,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_grid ON scores (grid_size, score DESC);
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreStore:
+    """Persistent leaderboard shared by every session and process.
+
+    Scores are appended as rows (never read-modify-write), so concurrent
+    writers cannot lose each other's updates; the best score is a MAX over
+    an index on (grid_size, score). Writes are buffered and flushed in one
+    transaction per batch by a background thread, and reads go through a
+    small TTL cache so per-frame UI redraws rarely touch SQLite.
+    """
+
+    def __init__(self, path: str = SCORES_DB, pool_size: int = 4, cache_ttl: float = 2.0,
+                 batch_size: int = 64, flush_interval: float = 0.5):
+        self.path = path
+        self.cache_ttl = cache_ttl
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+        self._pending: List[Tuple[int, int, Optional[str], float]] = []
+        self._pending_lock = threading.Lock()
+        self._cache: Dict[tuple, Tuple[float, object]] = {}
+        self._cache_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="score-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextlib.contextmanager
+    def _connection(self):
+        """Borrow a pooled connection"""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def submit(self, grid_size: int, score: int, player: Optional[str] = None):
+        """Queue a finished game's score; it is written with the next batch"""
+        with self._pending_lock:
+            self._pending.append((grid_size, score, player, time.time()))
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """Write every queued score in a single transaction"""
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            with self._connection() as conn:
+                try:
+                    conn.execute("BEGIN IMMEDIATE")  # Can fail with "database is locked"; re-queue then too
+                    conn.executemany(
+                        "INSERT INTO scores (grid_size, score, player, created) VALUES (?, ?, ?, ?)", batch)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
+        except BaseException:
+            with self._pending_lock:
+                self._pending[:0] = batch
+            raise
+        with self._cache_lock:
+            for grid_size in {row[0] for row in batch}:
+                self._cache.pop(("best", grid_size), None)
+                self._cache.pop(("top", grid_size), None)
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass  # Batch was re-queued; retry on the next round
+            except Exception:
+                # Re-queued as well, but unexpected: log it and keep the flusher running
+                logger.exception("could not write queued scores")
+
+    def _cached(self, key: tuple, query: str, args: tuple, convert):
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+        with self._connection() as conn:
+            value = convert(conn.execute(query, args).fetchall())
+        with self._cache_lock:
+            self._cache[key] = (now + self.cache_ttl, value)
+        return value
+
+    def best(self, grid_size: int) -> int:
+        """Best score ever recorded for a grid size (0 if none), including unflushed scores"""
+        stored = self._cached(("best", grid_size), "SELECT MAX(score) FROM scores WHERE grid_size = ?",
+                              (grid_size,), lambda rows: rows[0][0] or 0)
+        with self._pending_lock:
+            pending = max((row[1] for row in self._pending if row[0] == grid_size), default=0)
+        return max(stored, pending)
+
+    def top(self, grid_size: int, n: int = 10) -> List[Tuple[int, Optional[str], float]]:
+        """Top-n (score, player, created) rows for a grid size, best first"""
+        rows = self._cached(("top", grid_size),
+                            "SELECT score, player, created FROM scores WHERE grid_size = ? "
+                            "ORDER BY score DESC, id LIMIT 100", (grid_size,), list)
+        return rows[:n]
+
+    def close(self):
+        """Flush outstanding scores and close every pooled connection"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._flusher.join()
+        self.flush()
+        while not self._pool.empty():
+            self._pool.get().close()
+
+
+_default_store: Optional[ScoreStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_store() -> ScoreStore:
+    """Process-wide leaderboard shared by every session"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ScoreStore()
+        return _default_store
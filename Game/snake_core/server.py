@@ -0,0 +1,246 @@
+"""
+Snake Game Server
+Host many SnakeGame rooms in one asyncio process. A single fixed-rate
+scheduler advances every room: rooms that share a game speed are stepped
+together on one deadline, and each room's per-tick board diff is pushed to
+its websocket subscribers.
+
+Usage: python -m snake_core.server --host 0.0.0.0 --port 8765
+
+Protocol (one JSON object per text frame; directions are 0-3 = UP, RIGHT, DOWN, LEFT):
+  client -> server  {"type": "join", "room": "r1", "grid_size": 20, "speed": 200}
+                    {"type": "leave" | "start" | "pause", "room": "r1"}
+                    {"type": "turn", "room": "r1", "direction": 1}
+                    {"type": "turn", "room": "r1", "directions": [0, 3]}  (queued, one per tick)
+  server -> client  {"type": "state", "room": "r1", "tick": 0, "grid_size": 20, "speed": 200,
+                     "board": [...row-major cell values...], "score": 0, "game_over": false,
+                     "game_started": false, "paused": false}
+                    {"type": "diff", "room": "r1", "tick": 1, "cells": [x, y, value, ...],
+                     "score": 0, "game_over": false, "paused": false}
+                    {"type": "error", "message": "..."}
+
+A joining client gets a full "state" and then applies every "diff" to it.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from websockets.asyncio.server import ServerConnection, broadcast, serve
+from websockets.exceptions import ConnectionClosed
+
+from .events import get_default_bus
+from .game import DIRECTIONS, SnakeGame
+from .metrics import SERVER_METRICS_FILE, TickMetrics
+
+# Same ranges as the sliders of the Streamlit apps
+GRID_SIZES = range(10, 31)
+SPEEDS = range(100, 501)
+
+
+class Room:
+    """One game and the connections watching it"""
+
+    def __init__(self, room_id: str, grid_size: int, speed: int):
+        self.room_id = room_id
+        self.speed = speed
+        self.game = SnakeGame(grid_size, events=get_default_bus())
+        self.subscribers: Set[ServerConnection] = set()
+        self.tick = 0
+        self.sent_status = self.status()  # (score, game_over, paused) as of the last diff sent
+
+    def status(self) -> Tuple[int, bool, bool]:
+        game = self.game
+        return game.score, game.game_over, game.paused
+
+    def state_message(self) -> str:
+        game = self.game
+        return json.dumps({
+            "type": "state", "room": self.room_id, "tick": self.tick,
+            "grid_size": game.grid_size, "speed": self.speed, "board": list(game.board.cells),
+            "score": game.score, "game_over": game.game_over,
+            "game_started": game.game_started, "paused": game.paused,
+        })
+
+    def diff_message(self) -> str:
+        """Cells changed by the last tick, reset or status change"""
+        cells = []
+        for (x, y), value in self.game.board.changes.items():
+            cells += (x, y, value)
+        self.sent_status = self.status()
+        return json.dumps({
+            "type": "diff", "room": self.room_id, "tick": self.tick, "cells": cells,
+            "score": self.game.score, "game_over": self.game.game_over, "paused": self.game.paused,
+        }, separators=(",", ":"))
+
+
+class SpeedGroup:
+    """Rooms sharing one game speed, stepped together on one deadline"""
+
+    def __init__(self, speed: int, now: float):
+        self.interval = speed / 1000
+        self.rooms: Dict[str, Room] = {}
+        self.deadline = now + self.interval
+
+
+class GameServer:
+    """Rooms, their speed groups and the scheduler that ticks them.
+
+    Everything runs on the event loop thread, so rooms need no locking:
+    messages from clients are applied between ticks, in arrival order.
+    """
+
+    def __init__(self, max_rooms: int = 10000, metrics: Optional[TickMetrics] = None):
+        self.max_rooms = max_rooms
+        self.metrics = metrics if metrics is not None else TickMetrics(export_path=SERVER_METRICS_FILE)
+        self.rooms: Dict[str, Room] = {}
+        self.groups: Dict[int, SpeedGroup] = {}
+        self.missed_ticks = 0  # Deadlines dropped because a whole interval had already passed
+        self._wake = asyncio.Event()
+
+    def join(self, websocket: ServerConnection, room_id: str, grid_size: int, speed: int) -> Room:
+        """Subscribe to a room, creating it with this grid size and speed if it does not exist"""
+        room = self.rooms.get(room_id)
+        if room is None:
+            if grid_size not in GRID_SIZES or speed not in SPEEDS:
+                raise ValueError(f"grid_size must be in {GRID_SIZES.start}-{GRID_SIZES.stop - 1} "
+                                 f"and speed in {SPEEDS.start}-{SPEEDS.stop - 1} ms")
+            if len(self.rooms) >= self.max_rooms:
+                raise ValueError("server is full")
+            room = self.rooms[room_id] = Room(room_id, grid_size, speed)
+            group = self.groups.get(speed)
+            if group is None:
+                group = self.groups[speed] = SpeedGroup(speed, asyncio.get_running_loop().time())
+                self._wake.set()  # The scheduler may be sleeping past this group's first deadline
+            group.rooms[room_id] = room
+        room.subscribers.add(websocket)
+        return room
+
+    def leave(self, websocket: ServerConnection, room_id: str):
+        """Unsubscribe; a room with no subscribers left is closed"""
+        room = self.rooms.get(room_id)
+        if room is None:
+            return
+        room.subscribers.discard(websocket)
+        if room.subscribers:
+            return
+        del self.rooms[room_id]
+        group = self.groups[room.speed]
+        del group.rooms[room_id]
+        if not group.rooms:
+            del self.groups[room.speed]
+
+    def handle(self, websocket: ServerConnection, request: dict, joined: Set[str]) -> Optional[str]:
+        """Apply one client message; returns the reply for this client, if any"""
+        kind = request["type"]
+        room_id = str(request["room"])
+        if kind == "join":
+            room = self.join(websocket, room_id, int(request.get("grid_size", 20)), int(request.get("speed", 200)))
+            joined.add(room_id)
+            return room.state_message()
+        if room_id not in joined:
+            raise ValueError(f"not in room {room_id!r}")
+        room = self.rooms[room_id]
+        game = room.game
+        if kind == "leave":
+            joined.discard(room_id)
+            self.leave(websocket, room_id)
+        elif kind == "turn":
+            for direction in request.get("directions", [request.get("direction")]):
+                game.change_direction(DIRECTIONS[int(direction) % 4])
+        elif kind == "start":
+            game.reset_game()
+            game.game_started = True
+            broadcast(room.subscribers, room.diff_message())  # The reset delta, before the next tick clears it
+        elif kind == "pause":
+            game.toggle_pause()
+            game.board.clear_changes()
+            broadcast(room.subscribers, room.diff_message())
+        else:
+            raise ValueError(f"unknown message type {kind!r}")
+        return None
+
+    def step_group(self, group: SpeedGroup):
+        """Advance every room of the group by one tick, then send the diffs"""
+        start = time.perf_counter()
+        rooms = list(group.rooms.values())
+        for room in rooms:
+            room.game.move_snake()
+            room.tick += 1
+        start = self.metrics.lap("move", start)
+        for room in rooms:
+            # A self-collision ends the game without writing a cell, so status changes count too
+            if room.game.board.changes or room.status() != room.sent_status:
+                broadcast(room.subscribers, room.diff_message())
+        self.metrics.lap("emit", start)
+
+    async def run_scheduler(self):
+        """Step each speed group on its own fixed-rate deadline, forever"""
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            for group in list(self.groups.values()):
+                if group.deadline > now:
+                    continue
+                self.metrics.record("drift", now - group.deadline)
+                self.step_group(group)
+                # Next deadline follows the previous one, not the wake-up time, so lateness
+                # does not accumulate; a group more than a whole tick behind skips ahead
+                group.deadline += group.interval
+                if group.deadline <= now:
+                    missed = int((now - group.deadline) // group.interval) + 1
+                    group.deadline += missed * group.interval
+                    self.missed_ticks += missed
+            self.metrics.maybe_export()
+
+            self._wake.clear()
+            timeout = None
+            if self.groups:
+                timeout = max(0.0, min(group.deadline for group in self.groups.values()) - loop.time())
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def handler(self, websocket: ServerConnection):
+        """Serve one websocket connection until it closes"""
+        joined: Set[str] = set()
+        try:
+            async for message in websocket:
+                try:
+                    reply = self.handle(websocket, json.loads(message), joined)
+                except Exception as error:  # Any bad field (e.g. OverflowError from 1e400) is the client's error
+                    reply = json.dumps({"type": "error", "message": str(error)})
+                if reply is not None:
+                    await websocket.send(reply)
+        except ConnectionClosed:
+            pass
+        finally:
+            for room_id in joined:
+                self.leave(websocket, room_id)
+
+
+async def run_server(host: str = "localhost", port: int = 8765, max_rooms: int = 10000):
+    game_server = GameServer(max_rooms)
+    # Diffs are a few dozen bytes, so per-message compression would cost more CPU than it saves
+    async with serve(game_server.handler, host, port, compression=None):
+        await game_server.run_scheduler()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve many Snake rooms over websockets")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-rooms", type=int, default=10000)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run_server(args.host, args.port, args.max_rooms))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,84 +1,17 @@
-import streamlit as st
-import numpy as np
 import time
-import random
-from typing import List, Tuple, Optional
 
-class SnakeGame:
-    def __init__(self, grid_size: int = 20):
-        self.grid_size = grid_size
-        self.reset_game()
-    
-    def reset_game(self):
-        """Reset the game to initial state"""
-        self.snake = [(grid_size // 2, grid_size // 2)]  # Start at center
-        self.direction = (1, 0)  # Start moving right
-        self.food = self.generate_food()
-        self.score = 0
-        self.game_over = False
-        self.game_started = False
-    
-    def generate_food(self) -> Tuple[int, int]:
-        """Generate food at random position, avoiding snake body"""
-        while True:
-            food = (random.randint(0, self.grid_size - 1), 
-                   random.randint(0, self.grid_size - 1))
-            if food not in self.snake:
-                return food
-    
-    def move_snake(self):
-        """Move the snake in current direction"""
-        if self.game_over or not self.game_started:
-            return
-        
-        # Calculate new head position
-        new_head = (
-            (self.snake[0][0] + self.direction[0]) % self.grid_size,
-            (self.snake[0][1] + self.direction[1]) % self.grid_size
-        )
-        
-        # Check collision with self
-        if new_head in self.snake:
-            self.game_over = True
-            return
-        
-        # Add new head
-        self.snake.insert(0, new_head)
-        
-        # Check if food is eaten
-        if new_head == self.food:
-            self.score += 10
-            self.food = self.generate_food()
-        else:
-            # Remove tail if no food eaten
-            self.snake.pop()
-    
-    def change_direction(self, new_direction: Tuple[int, int]):
-        """Change snake direction (prevent 180-degree turns)"""
-        if not self.game_over and self.game_started:
-            # Prevent opposite direction movement
-            if (new_direction[0] != -self.direction[0] or 
-                new_direction[1] != -self.direction[1]):
-                self.direction = new_direction
-    
-    def get_grid_state(self) -> np.ndarray:
-        """Get current grid state for visualization"""
-        grid = np.zeros((self.grid_size, self.grid_size), dtype=int)
-        
-        # Mark snake body
-        for i, segment in enumerate(self.snake):
-            if i == 0:  # Head
-                grid[segment[1], segment[0]] = 2
-            else:  # Body
-                grid[segment[1], segment[0]] = 1
-        
-        # Mark food
-        grid[self.food[1], self.food[0]] = 3
-        
-        return grid
+from snake_core import SnakeGame
+from snake_core.clock import FixedStepClock
+from snake_core.events import get_default_bus
+from snake_core.metrics import TICK_METRICS
 
 def create_game_ui():
     """Create the main game UI"""
+    script_start = time.perf_counter()
+    import streamlit as st
+    from snake_ui.debug import render_debug_panel
+    from snake_ui.render import GRID_SIZES, VIEWPORT_SIZE, crop_viewport, render_grid_html
+    
     st.set_page_config(
         page_title="Snake Game",
         page_icon="🐍",
@@ -123,8 +56,12 @@ def create_game_ui():
     # Sidebar for game settings
     with st.sidebar:
         st.header("Game Settings")
-        grid_size = st.slider("Grid Size", 10, 30, 20, help="Size of the game grid")
+        grid_size = st.select_slider("Grid Size", GRID_SIZES, 20,
+                                     help=f"Size of the game grid (above {VIEWPORT_SIZE}x{VIEWPORT_SIZE} "
+                                          "the view follows the snake)")
         game_speed = st.slider("Game Speed (ms)", 100, 500, 200, help="Speed of snake movement")
+        show_metrics = st.checkbox("🛠️ Show performance panel", value=False,
+                                   help="Per-phase tick timings (p50/p95/p99) and frame interval drift")
         
         st.markdown("---")
         st.markdown("### How to Play")
@@ -138,11 +75,11 @@ def create_game_ui():
     
     # Initialize game state
     if 'game' not in st.session_state:
-        st.session_state.game = SnakeGame(grid_size)
+        st.session_state.game = SnakeGame(grid_size, events=get_default_bus())
     
     # Update game with new grid size if changed
     if st.session_state.game.grid_size != grid_size:
-        st.session_state.game = SnakeGame(grid_size)
+        st.session_state.game = SnakeGame(grid_size, events=get_default_bus())
     
     # Score display
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -160,6 +97,8 @@ def create_game_ui():
         if st.button("🎮 Start/Restart Game", type="primary", use_container_width=True):
             st.session_state.game.reset_game()
             st.session_state.game.game_started = True
+            st.session_state.last_frame = None
+            st.session_state.clock = FixedStepClock(game_speed / 1000)
             st.rerun()
     
     # Direction controls
@@ -191,36 +130,40 @@ def create_game_ui():
     
     # Game grid visualization
     if st.session_state.game.game_started:
-        # Move snake
-        st.session_state.game.move_snake()
+        # Move snake once per tick due since the last frame (none if this rerun came early)
+        clock = st.session_state.get('clock')
+        if clock is None:
+            clock = st.session_state.clock = FixedStepClock(game_speed / 1000)
+        clock.interval = game_speed / 1000
+        tick_start = time.perf_counter()
+        steps = clock.due()
+        for _ in range(steps):
+            st.session_state.game.move_snake()
+        tick_start = TICK_METRICS.lap("move", tick_start)
         
-        # Get grid state
+        # Get grid state (a window on the head for large boards)
         grid = st.session_state.game.get_grid_state()
+        if st.session_state.game.grid_size > VIEWPORT_SIZE:
+            grid = crop_viewport(grid, st.session_state.game.snake.head)
+        tick_start = TICK_METRICS.lap("grid", tick_start)
         
-        # Create visual representation
-        grid_display = []
-        for row in grid:
-            row_display = []
-            for cell in row:
-                if cell == 0:  # Empty
-                    row_display.append("⬜")
-                elif cell == 1:  # Snake body
-                    row_display.append("🟩")
-                elif cell == 2:  # Snake head
-                    row_display.append("🟢")
-                elif cell == 3:  # Food
-                    row_display.append("🍎")
-            grid_display.append(" ".join(row_display))
+        # Display grid as a single element
+        board_html = render_grid_html(grid, "text-align: center; font-family: monospace; font-size: 1.2rem;")
+        tick_start = TICK_METRICS.lap("render", tick_start)
+        st.markdown(board_html, unsafe_allow_html=True)
+        TICK_METRICS.lap("emit", tick_start)
         
-        # Display grid
-        st.markdown('<div class="game-container">', unsafe_allow_html=True)
-        for row in grid_display:
-            st.markdown(f"<div style='text-align: center; font-family: monospace; font-size: 1.2rem;'>{row}</div>", 
-                       unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Frame timings: script work so far, the real interval between frames and how late the tick ran
+        TICK_METRICS.lap("script", script_start)
+        if steps:
+            st.session_state.last_frame = TICK_METRICS.record_frame(st.session_state.get('last_frame'), clock.lateness)
+        TICK_METRICS.maybe_export()
+        if show_metrics:
+            with st.sidebar:
+                render_debug_panel(TICK_METRICS, game_speed / 1000, clock)
         
-        # Auto-refresh for continuous gameplay
-        time.sleep(game_speed / 1000)
+        # Auto-refresh for continuous gameplay: sleep only until the next tick is due
+        time.sleep(clock.remaining())
         st.rerun()
 
 if __name__ == "__main__":
@@ -1,114 +1,24 @@
-import streamlit as st
-import numpy as np
-import time
 import random
-from typing import List, Tuple, Optional
-import json
+import time
 
-class SnakeGame:
-    def __init__(self, grid_size: int = 20):
-        self.grid_size = grid_size
-        self.reset_game()
-    
-    def reset_game(self):
-        """Reset the game to initial state"""
-        self.snake = [(self.grid_size // 2, self.grid_size // 2)]  # Start at center
-        self.direction = (1, 0)  # Start moving right
-        self.food = self.generate_food()
-        self.score = 0
-        self.game_over = False
-        self.game_started = False
-        self.paused = False
-        self.high_score = self.load_high_score()
-    
-    def load_high_score(self) -> int:
-        """Load high score from session state"""
-        return st.session_state.get('high_score', 0)
-    
-    def save_high_score(self):
-        """Save high score to session state"""
-        if self.score > self.high_score:
-            st.session_state.high_score = self.score
-            self.high_score = self.score
-    
-    def generate_food(self) -> Tuple[int, int]:
-        """Generate food at random position, avoiding snake body"""
-        attempts = 0
-        max_attempts = self.grid_size * self.grid_size
-        
-        while attempts < max_attempts:
-            food = (random.randint(0, self.grid_size - 1), 
-                   random.randint(0, self.grid_size - 1))
-            if food not in self.snake:
-                return food
-            attempts += 1
-        
-        # If no space found, return a position anyway (game is won!)
-        return (0, 0)
-    
-    def move_snake(self):
-        """Move the snake in current direction"""
-        if self.game_over or not self.game_started or self.paused:
-            return
-        
-        # Calculate new head position
-        new_head = (
-            (self.snake[0][0] + self.direction[0]) % self.grid_size,
-            (self.snake[0][1] + self.direction[1]) % self.grid_size
-        )
-        
-        # Check collision with self
-        if new_head in self.snake:
-            self.game_over = True
-            self.save_high_score()
-            return
-        
-        # Add new head
-        self.snake.insert(0, new_head)
-        
-        # Check if food is eaten
-        if new_head == self.food:
-            self.score += 10
-            self.food = self.generate_food()
-            # Check if snake fills entire grid (win condition)
-            if len(self.snake) >= self.grid_size * self.grid_size:
-                self.game_over = True
-                self.save_high_score()
-        else:
-            # Remove tail if no food eaten
-            self.snake.pop()
-    
-    def change_direction(self, new_direction: Tuple[int, int]):
-        """Change snake direction (prevent 180-degree turns)"""
-        if not self.game_over and self.game_started and not self.paused:
-            # Prevent opposite direction movement
-            if (new_direction[0] != -self.direction[0] or 
-                new_direction[1] != -self.direction[1]):
-                self.direction = new_direction
-    
-    def toggle_pause(self):
-        """Toggle game pause state"""
-        if self.game_started and not self.game_over:
-            self.paused = not self.paused
-    
-    def get_grid_state(self) -> np.ndarray:
-        """Get current grid state for visualization"""
-        grid = np.zeros((self.grid_size, self.grid_size), dtype=int)
-        
-        # Mark snake body
-        for i, segment in enumerate(self.snake):
-            if i == 0:  # Head
-                grid[segment[1], segment[0]] = 2
-            else:  # Body
-                grid[segment[1], segment[0]] = 1
-        
-        # Mark food
-        grid[self.food[1], self.food[0]] = 3
-        
-        return grid
+from snake_core import SnakeGame
+from snake_core.autopilot import Autopilot
+from snake_core.clock import FixedStepClock
+from snake_core.events import get_default_bus
+from snake_core.hamiltonian import HamiltonianSolver
+from snake_core.metrics import TICK_METRICS
+from snake_core.scores import get_default_store
+
+# Autopilot choices in the sidebar
+AUTOPILOTS = {"Off": None, "Shortest path": Autopilot, "Hamiltonian (always wins)": HamiltonianSolver}
 
 def create_enhanced_game_ui():
     """Create the enhanced game UI with keyboard support"""
+    script_start = time.perf_counter()
+    import streamlit as st
+    from snake_ui.debug import render_debug_panel
+    from snake_ui.render import GRID_SIZES, VIEWPORT_SIZE, Minimap, crop_viewport, render_grid_html, render_minimap_html
+    
     st.set_page_config(
         page_title="Snake Game Enhanced",
         page_icon="🐍",
@@ -172,8 +82,25 @@ def create_enhanced_game_ui():
     # Sidebar for game settings
     with st.sidebar:
         st.header("🎮 Game Settings")
-        grid_size = st.slider("Grid Size", 10, 30, 20, help="Size of the game grid")
+        grid_size = st.select_slider("Grid Size", GRID_SIZES, 20,
+                                     help=f"Size of the game grid (above {VIEWPORT_SIZE}x{VIEWPORT_SIZE} "
+                                          "the view follows the snake)")
         game_speed = st.slider("Game Speed (ms)", 100, 500, 200, help="Speed of snake movement")
+        show_metrics = st.checkbox("🛠️ Show performance panel", value=False,
+                                   help="Per-phase tick timings (p50/p95/p99) and frame interval drift")
+        show_minimap = st.checkbox("🗺️ Show minimap", value=True, disabled=grid_size <= VIEWPORT_SIZE,
+                                   help=f"Overview of boards larger than {VIEWPORT_SIZE}x{VIEWPORT_SIZE}")
+        client_loop = st.checkbox("🖥️ Run game loop in browser", value=False, disabled=grid_size > VIEWPORT_SIZE,
+                                  help="Tick the game in the browser; the server is only contacted on start and game over "
+                                       f"(boards up to {VIEWPORT_SIZE}x{VIEWPORT_SIZE})")
+        client_loop = client_loop and grid_size <= VIEWPORT_SIZE
+        # A shortest-path search scales with the whole board, so large boards only offer the O(1) cycle
+        autopilots = [name for name, pilot_class in AUTOPILOTS.items()
+                      if pilot_class is not Autopilot or grid_size <= VIEWPORT_SIZE]
+        autopilot = st.selectbox("🤖 Autopilot", autopilots, disabled=client_loop,
+                                 help="Let the game play itself (server-side game loop only). "
+                                      "Hamiltonian follows a cycle through every cell with safe shortcuts, so it always wins; "
+                                      f"shortest path is offered on boards up to {VIEWPORT_SIZE}x{VIEWPORT_SIZE}")
         
         st.markdown("---")
         st.header("🎯 How to Play")
@@ -193,24 +120,32 @@ def create_enhanced_game_ui():
         
         st.markdown("---")
         st.header("🏆 High Scores")
-        high_score = st.session_state.get('high_score', 0)
-        st.metric("Best Score", high_score)
+        high_score = get_default_store().best(grid_size)
+        st.metric(f"Best Score ({grid_size}x{grid_size})", high_score)
+        top_scores = get_default_store().top(grid_size, 5)
+        if top_scores:
+            st.markdown("\n".join(f"{rank}. {score}" for rank, (score, _, _) in enumerate(top_scores, 1)))
+    
+    if client_loop:
+        create_client_game_ui(grid_size, game_speed, high_score)
+        return
     
     # Initialize game state
-    if 'game' not in st.session_state:
-        st.session_state.game = SnakeGame(grid_size)
+    if 'enhanced_game' not in st.session_state:
+        st.session_state.enhanced_game = SnakeGame(grid_size, score_store=get_default_store(), events=get_default_bus())
     
     # Update game with new grid size if changed
-    if st.session_state.game.grid_size != grid_size:
-        st.session_state.game = SnakeGame(grid_size)
+    if st.session_state.enhanced_game.grid_size != grid_size:
+        close_replay(st.session_state.enhanced_game)
+        st.session_state.enhanced_game = SnakeGame(grid_size, score_store=get_default_store(), events=get_default_bus())
     
     # Score display
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
         st.markdown(f"""
         <div class="score-display">
-            <h2>Score: {st.session_state.game.score}</h2>
-            <p>Snake Length: {len(st.session_state.game.snake)} | High Score: {st.session_state.game.high_score}</p>
+            <h2>Score: {st.session_state.enhanced_game.score}</h2>
+            <p>Snake Length: {len(st.session_state.enhanced_game.snake)} | High Score: {st.session_state.enhanced_game.high_score}</p>
         </div>
         """, unsafe_allow_html=True)
     
@@ -218,8 +153,15 @@ def create_enhanced_game_ui():
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
         if st.button("🎮 Start/Restart Game", type="primary", use_container_width=True):
-            st.session_state.game.reset_game()
-            st.session_state.game.game_started = True
+            from snake_core.replay import open_replay
+            
+            close_replay(st.session_state.enhanced_game)
+            seed = random.SystemRandom().getrandbits(63)
+            st.session_state.enhanced_game.reset_game(seed)
+            st.session_state.enhanced_game.game_started = True
+            st.session_state.enhanced_last_frame = None
+            st.session_state.enhanced_clock = FixedStepClock(game_speed / 1000)
+            st.session_state.replay = open_replay(st.session_state.enhanced_game, seed)
             st.rerun()
     
     # Direction controls
@@ -227,23 +169,23 @@ def create_enhanced_game_ui():
     
     with col2:
         if st.button("⬆️ Up", use_container_width=True):
-            st.session_state.game.change_direction((0, -1))
+            st.session_state.enhanced_game.change_direction((0, -1))
     
     with col1:
         if st.button("⬅️ Left", use_container_width=True):
-            st.session_state.game.change_direction((-1, 0))
+            st.session_state.enhanced_game.change_direction((-1, 0))
     
     with col3:
         if st.button("⬇️ Down", use_container_width=True):
-            st.session_state.game.change_direction((0, 1))
+            st.session_state.enhanced_game.change_direction((0, 1))
     
     with col4:
         if st.button("➡️ Right", use_container_width=True):
-            st.session_state.game.change_direction((1, 0))
+            st.session_state.enhanced_game.change_direction((1, 0))
     
     with col5:
         if st.button("⏸️ Pause", use_container_width=True):
-            st.session_state.game.toggle_pause()
+            st.session_state.enhanced_game.toggle_pause()
     
     # Keyboard controls hint
     st.markdown("""
@@ -253,8 +195,8 @@ def create_enhanced_game_ui():
     """, unsafe_allow_html=True)
     
     # Game status
-    if st.session_state.game.game_over:
-        if len(st.session_state.game.snake) >= st.session_state.game.grid_size * st.session_state.game.grid_size:
+    if st.session_state.enhanced_game.game_over:
+        if len(st.session_state.enhanced_game.snake) >= st.session_state.enhanced_game.grid_size * st.session_state.enhanced_game.grid_size:
             st.markdown("""
             <div class="game-status" style="background-color: #d4edda; color: #155724;">
                 🎉 Congratulations! You've filled the entire grid! You win!
@@ -266,13 +208,13 @@ def create_enhanced_game_ui():
                 💀 Game Over! Press Start/Restart to play again.
             </div>
             """, unsafe_allow_html=True)
-    elif st.session_state.game.paused:
+    elif st.session_state.enhanced_game.paused:
         st.markdown("""
         <div class="game-status" style="background-color: #fff3cd; color: #856404;">
             ⏸️ Game Paused! Press Pause again or Space to resume.
         </div>
         """, unsafe_allow_html=True)
-    elif st.session_state.game.game_started:
+    elif st.session_state.enhanced_game.game_started:
         st.markdown("""
         <div class="game-status" style="background-color: #d1ecf1; color: #0c5460;">
             🎯 Game Running! Use controls to play.
@@ -286,38 +228,93 @@ def create_enhanced_game_ui():
         """, unsafe_allow_html=True)
     
     # Game grid visualization
-    if st.session_state.game.game_started:
-        # Move snake
-        st.session_state.game.move_snake()
+    if st.session_state.enhanced_game.game_started:
+        # Move snake once per tick due since the last frame, recording each tick that actually moved
+        game = st.session_state.enhanced_game
+        clock = st.session_state.get('enhanced_clock')
+        if clock is None:
+            clock = st.session_state.enhanced_clock = FixedStepClock(game_speed / 1000)
+        clock.interval = game_speed / 1000
+        tick_start = time.perf_counter()
+        pilot_class = AUTOPILOTS[autopilot]
+        steps = clock.due()
+        for _ in range(steps):
+            moving = not game.game_over and not game.paused
+            if pilot_class is not None and moving:
+                pilot = st.session_state.get('autopilot')
+                if type(pilot) is not pilot_class or pilot.grid_size != game.grid_size:
+                    pilot = st.session_state.autopilot = pilot_class(game.grid_size)
+                direction = pilot.next_direction(game)
+                game.inputs.clear()  # The autopilot steers; drop any queued button presses
+                if direction is not None:
+                    game.change_direction(direction)
+            game.move_snake()
+            if moving and st.session_state.get('replay') is not None:
+                st.session_state.replay.record(game)
+                if game.game_over:
+                    close_replay(game)
+        tick_start = TICK_METRICS.lap("move", tick_start)
         
-        # Get grid state
-        grid = st.session_state.game.get_grid_state()
+        # Get grid state (a window on the head for large boards)
+        grid = st.session_state.enhanced_game.get_grid_state()
+        large = game.grid_size > VIEWPORT_SIZE
+        if large:
+            grid = crop_viewport(grid, game.snake.head)
+        tick_start = TICK_METRICS.lap("grid", tick_start)
         
-        # Create visual representation with better styling
-        grid_display = []
-        for row in grid:
-            row_display = []
-            for cell in row:
-                if cell == 0:  # Empty
-                    row_display.append("⬜")
-                elif cell == 1:  # Snake body
-                    row_display.append("🟩")
-                elif cell == 2:  # Snake head
-                    row_display.append("🟢")
-                elif cell == 3:  # Food
-                    row_display.append("🍎")
-            grid_display.append(" ".join(row_display))
+        # Display grid with better styling as a single element
+        board_html = render_grid_html(grid, "text-align: center; font-family: monospace; font-size: 1.3rem; line-height: 1.2;")
+        if large and show_minimap:
+            minimap = st.session_state.get('minimap')
+            if minimap is None or minimap.board is not game.board:
+                minimap = st.session_state.minimap = Minimap(game.board)
+            minimap_html = render_minimap_html(minimap, game.snake.head,
+                                               "text-align: center; font-family: monospace; font-size: 0.6rem; line-height: 1.0;")
+        tick_start = TICK_METRICS.lap("render", tick_start)
+        st.markdown(board_html, unsafe_allow_html=True)
+        if large and show_minimap:
+            with st.sidebar:
+                st.markdown(minimap_html, unsafe_allow_html=True)
+        TICK_METRICS.lap("emit", tick_start)
         
-        # Display grid with better styling
-        st.markdown('<div class="game-container">', unsafe_allow_html=True)
-        for row in grid_display:
-            st.markdown(f"<div style='text-align: center; font-family: monospace; font-size: 1.3rem; line-height: 1.2;'>{row}</div>", 
-                       unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Frame timings: script work so far, the real interval between frames and how late the tick ran
+        TICK_METRICS.lap("script", script_start)
+        if steps:
+            st.session_state.enhanced_last_frame = TICK_METRICS.record_frame(
+                st.session_state.get('enhanced_last_frame'), clock.lateness)
+        TICK_METRICS.maybe_export()
+        if show_metrics:
+            with st.sidebar:
+                render_debug_panel(TICK_METRICS, game_speed / 1000, clock)
         
-        # Auto-refresh for continuous gameplay
-        time.sleep(game_speed / 1000)
+        # Auto-refresh for continuous gameplay: sleep only until the next tick is due
+        time.sleep(clock.remaining())
         st.rerun()
 
+def close_replay(game):
+    """Finish the session's replay recording, if any"""
+    import streamlit as st
+    
+    replay = st.session_state.get('replay')
+    if replay is not None:
+        replay.close(game)
+        st.session_state.replay = None
+
+def create_client_game_ui(grid_size: int, game_speed: int, high_score: int):
+    """Game UI for the browser-side loop: no server ticks, one rerun per start/game over"""
+    import streamlit as st
+    from snake_ui.client import client_game
+    
+    result = client_game(grid_size, game_speed, high_score=high_score, key="client_game")
+    
+    # Record each finished game once, however many times the script reruns
+    if (result and result.get("event") == "game_over"
+            and result.get("game_id") != st.session_state.get("client_game_id")):
+        st.session_state.client_game_id = result["game_id"]
+        if result["score"] > 0:
+            get_default_store().submit(grid_size, result["score"])
+        if result["score"] > high_score:
+            st.rerun()  # Refresh the sidebar Best Score
+
 if __name__ == "__main__":
     create_enhanced_game_ui() 
\ No newline at end of file
@@ -0,0 +1 @@
+"""Streamlit front-end pieces shared by both game variants"""
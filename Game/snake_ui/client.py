@@ -0,0 +1,27 @@
+import os
+from typing import Optional
+
+import streamlit.components.v1 as components
+
+# The browser-side game lives in a plain HTML file, so no JS build step is needed
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "client_frontend")
+_snake_client = components.declare_component("snake_client", path=_FRONTEND_DIR)
+
+
+def client_game(grid_size: int, game_speed: int, high_score: int = 0,
+                key: Optional[str] = None) -> Optional[dict]:
+    """Run the game loop in the browser and return its last event.
+
+    The component ticks the board itself with the same rules as SnakeGame, so
+    the script only reruns when a game starts or ends instead of on every
+    tick. Events look like ``{"event": "start", "game_id": ...}`` and
+    ``{"event": "game_over", "game_id": ..., "score": ..., "length": ...,
+    "ticks": ..., "won": ...}``; None until the first game starts.
+    """
+    return _snake_client(
+        grid_size=grid_size,
+        game_speed=game_speed,
+        high_score=high_score,
+        key=key,
+        default=None,
+    )
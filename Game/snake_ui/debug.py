@@ -0,0 +1,23 @@
+from typing import Optional
+
+import streamlit as st
+
+from snake_core.clock import FixedStepClock
+from snake_core.metrics import PHASES, PHASE_HELP, TickMetrics
+
+
+def render_debug_panel(metrics: TickMetrics, target_interval: float, clock: Optional[FixedStepClock] = None):
+    """Sidebar table of per-phase p50/p95/p99, plus the session's catch-up counts"""
+    rows = ["| phase | p50 ms | p95 ms | p99 ms | ticks |", "|---|---|---|---|---|"]
+    for phase in PHASES:
+        values = metrics.percentiles(phase)
+        if values is None:
+            continue
+        p50, p95, p99 = (value * 1000 for value in values)
+        rows.append(f"| {phase} | {p50:.2f} | {p95:.2f} | {p99:.2f} | {metrics.counts[phase]} |")
+    st.markdown("\n".join(rows))
+    if clock is not None:
+        st.caption(f"This game: {clock.caught_up} ticks caught up by late frames, "
+                   f"{clock.missed} dropped (over {clock.max_steps} per frame).")
+    st.caption(f"Target frame interval: {target_interval * 1000:.0f} ms. "
+               + "; ".join(f"{phase}: {help_text}" for phase, help_text in PHASE_HELP.items()))
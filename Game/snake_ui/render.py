@@ -0,0 +1,86 @@
+from typing import Tuple
+
+import numpy as np
+
+from snake_core.grid import CHUNK_SIZE, EMPTY, BODY, HEAD, FOOD, BoardGrid
+
+# Lookup table from cell value to its emoji (with the column separator)
+CELL_SYMBOLS = np.empty(4, dtype="<U2")
+CELL_SYMBOLS[EMPTY] = "⬜ "
+CELL_SYMBOLS[BODY] = "🟩 "
+CELL_SYMBOLS[HEAD] = "🟢 "
+CELL_SYMBOLS[FOOD] = "🍎 "
+
+# Boards up to this size are drawn whole; larger ones through a camera window on the head
+VIEWPORT_SIZE = 30
+# Grid sizes the apps offer: every size up to the viewport, then large boards
+GRID_SIZES = list(range(10, VIEWPORT_SIZE + 1)) + [50, 100, 250, 500, 1000]
+# Most cells per side of the drawn minimap (each one covering one or more chunks)
+MINIMAP_SIZE = 32
+
+
+def render_grid_html(grid: np.ndarray, style: str = "") -> str:
+    """Render the whole board as a single HTML element.
+
+    The grid is mapped through CELL_SYMBOLS with one fancy-indexing call and
+    the resulting fixed-width UTF-32 buffer is decoded in one go, so there is
+    no per-cell Python work and the UI needs one st.markdown call per frame
+    instead of one per row.
+    """
+    text = CELL_SYMBOLS[grid].tobytes().decode("utf-32-le")
+    width = grid.shape[1] * CELL_SYMBOLS.itemsize // 4
+    board = "<br>".join([text[i:i + width] for i in range(0, len(text), width)])
+    return f'<div class="game-container"><div style="{style}">{board}</div></div>'
+
+
+def crop_viewport(grid: np.ndarray, center: Tuple[int, int], width: int = VIEWPORT_SIZE,
+                  height: int = VIEWPORT_SIZE) -> np.ndarray:
+    """The width x height window of the wrapped board centred on a cell.
+
+    Only the window's rows and columns are gathered (one fancy-indexing
+    call), so the cost depends on the window, not on the board size.
+    """
+    rows = (np.arange(height) + (center[1] - height // 2)) % grid.shape[0]
+    cols = (np.arange(width) + (center[0] - width // 2)) % grid.shape[1]
+    return grid[np.ix_(rows, cols)]
+
+
+class Minimap:
+    """Downsampled overview of a large board: one value per board chunk, the
+    highest cell value in it (so food shows over snake, snake over empty).
+
+    The chunk values are computed in full once, then update() recomputes
+    only the chunks the board marked dirty since, so keeping the minimap
+    current costs a few chunks per frame rather than the whole board. It
+    takes the board's dirty chunks, so keep one Minimap per board.
+    """
+
+    def __init__(self, board: BoardGrid):
+        self.board = board
+        side = board.chunks_per_row
+        padded = np.zeros((side * CHUNK_SIZE, side * CHUNK_SIZE), dtype=np.uint8)
+        padded[:board.grid_size, :board.grid_size] = board.array
+        self.chunks = padded.reshape(side, CHUNK_SIZE, side, CHUNK_SIZE).max(axis=(1, 3))
+        board.take_dirty_chunks()
+
+    def update(self) -> np.ndarray:
+        """Chunk values, refreshed from the chunks written since the last update"""
+        grid = self.board.array
+        for chunk in self.board.take_dirty_chunks():
+            y, x = divmod(chunk, self.board.chunks_per_row)
+            self.chunks[y, x] = grid[y * CHUNK_SIZE:(y + 1) * CHUNK_SIZE, x * CHUNK_SIZE:(x + 1) * CHUNK_SIZE].max()
+        return self.chunks
+
+
+def render_minimap_html(minimap: Minimap, head: Tuple[int, int], style: str = "") -> str:
+    """Render the minimap, pooled down to at most MINIMAP_SIZE cells a side,
+    with the cell holding the head drawn as the head"""
+    chunks = minimap.update()
+    factor = -(-chunks.shape[0] // MINIMAP_SIZE)
+    side = -(-chunks.shape[0] // factor)
+    view = np.zeros((side * factor, side * factor), dtype=np.uint8)
+    view[:chunks.shape[0], :chunks.shape[1]] = chunks
+    view = view.reshape(side, factor, side, factor).max(axis=(1, 3))
+    span = CHUNK_SIZE * factor
+    view[head[1] // span, head[0] // span] = HEAD
+    return render_grid_html(view, style)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The engine is imported as a top-level package from the Game directory, as the benchmarks do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
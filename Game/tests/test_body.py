@@ -0,0 +1,55 @@
+import random
+
+from snake_core.body import MOVES, SnakeBody
+
+
+def random_walk(grid_size, length, rng):
+    """Head cell index, move codes and cells of a self-avoiding walk of up to length cells"""
+    head = (grid_size // 2, grid_size // 2)
+    cells, moves = [head], []
+    for _ in range(20 * length):
+        if len(cells) == length:
+            break
+        code = rng.randrange(4)
+        dx, dy = MOVES[code]
+        cell = ((cells[-1][0] + dx) % grid_size, (cells[-1][1] + dy) % grid_size)
+        if cell not in cells:
+            cells.append(cell)
+            moves.append(code)
+    return head[1] * grid_size + head[0], bytes(moves), cells
+
+
+def test_from_cells_and_from_moves_match_incremental_build():
+    rng = random.Random(7)
+    # 200 is past WALK_TABLE_MAX, so from_moves takes its arithmetic path
+    for grid_size in (3, 20, 40, 200):
+        head, moves, cells = random_walk(grid_size, min(grid_size * grid_size, 300), rng)
+        expected = SnakeBody(grid_size, cells)
+        for body in (SnakeBody.from_cells(grid_size, cells), SnakeBody.from_moves(grid_size, head, moves)):
+            assert list(body) == cells
+            assert body.occupied == expected.occupied
+            assert body.free_blocks == expected.free_blocks
+            assert body.free_count == expected.free_count == grid_size * grid_size - len(cells)
+
+
+def test_random_free_cell_depends_only_on_covered_cells():
+    grid_size = 40
+    cells = [(x, y) for y in range(grid_size) for x in range(grid_size)]
+    for fill in (0.1, 0.9, 0.999):
+        taken = random.Random(fill).sample(cells, int(len(cells) * fill))
+        shuffled = random.Random(1).sample(taken, len(taken))
+        picks = []
+        for order in (taken, shuffled):
+            body = SnakeBody(grid_size, order)
+            rng = random.Random(5)
+            picks.append([body.random_free_cell(rng) for _ in range(50)])
+        assert picks[0] == picks[1]
+        assert not set(picks[0]) & set(taken)
+
+
+def test_random_free_cell_on_full_and_last_free_cell():
+    cells = [(x, y) for y in range(3) for x in range(3)]
+    body = SnakeBody(3, cells)
+    assert body.random_free_cell(random.Random(0)) is None
+    body.pop_tail()
+    assert body.random_free_cell(random.Random(0)) == cells[-1]
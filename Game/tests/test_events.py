@@ -0,0 +1,25 @@
+import time
+
+import pytest
+
+from snake_core.events import TICK, BinarySink, EventBus, FileSink, read_events
+
+
+def test_file_sink_is_abstract(tmp_path):
+    with pytest.raises(TypeError):
+        FileSink(str(tmp_path / "events.log"))
+
+
+def test_encoder_error_does_not_stop_the_writer(tmp_path):
+    path = str(tmp_path / "events.log")
+    bus = EventBus([BinarySink(path)], flush_interval=0.01)
+    bus.emit(1, 1, TICK, 0, 0, 2 ** 40)  # Overflows the int32 value field: struct.error in encode
+    deadline = time.monotonic() + 5
+    while bus.errors == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert bus.errors == 1
+    assert bus._writer.is_alive()
+
+    bus.emit(1, 2, TICK, 3, 4, 5)
+    bus.close()
+    assert [(event.tick, event.x, event.y, event.value) for event in read_events(path)] == [(2, 3, 4, 5)]
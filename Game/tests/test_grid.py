@@ -0,0 +1,14 @@
+import pytest
+
+from snake_core import SnakeGame
+from snake_core.grid import FOOD, HEAD
+
+
+def test_grid_state_is_read_only_view():
+    game = SnakeGame(10, seed=1)
+    grid = game.get_grid_state()
+    with pytest.raises(ValueError):
+        grid[0, 0] = FOOD
+    # Still a live view of the engine's cells
+    game.board.set((0, 0), HEAD)
+    assert grid[0, 0] == HEAD
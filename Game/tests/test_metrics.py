@@ -0,0 +1,36 @@
+import os
+import threading
+
+from snake_core.metrics import TickMetrics
+
+
+def test_concurrent_exports_do_not_race(tmp_path):
+    path = str(tmp_path / "snake.prom")
+    metrics = TickMetrics(export_path=path, export_interval=0.0)
+    metrics.record("move", 0.001)
+    errors = []
+    start = threading.Barrier(8)
+
+    def export():
+        start.wait()
+        try:
+            for _ in range(200):
+                metrics.maybe_export()
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=export) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert os.listdir(tmp_path) == ["snake.prom"]
+    with open(path) as f:
+        assert 'phase="move"' in f.read()
+
+
+def test_failed_export_does_not_raise(tmp_path):
+    metrics = TickMetrics(export_path=str(tmp_path / "missing" / "snake.prom"), export_interval=0.0)
+    metrics.maybe_export()
@@ -0,0 +1,71 @@
+import random
+
+from snake_core import SnakeGame
+from snake_core.autopilot import Autopilot
+from snake_core.game import DIRECTIONS
+from snake_core.replay import HEADER, KEYFRAME, ReplayReader, ReplayWriter, verify_replay
+
+KEYFRAME_INTERVAL = 16
+
+
+def record_game(path, seed=11, ticks=100):
+    """Play a game into a replay, chasing the food with some random turns; returns the
+    live state after every tick"""
+    game = SnakeGame(10)
+    game.reset_game(seed)
+    game.game_started = True
+    writer = ReplayWriter(path, game, seed, keyframe_interval=KEYFRAME_INTERVAL)
+    rng = random.Random(seed)
+    pilot = Autopilot(game.grid_size)
+    states = [(list(game.snake), game.food, game.direction, game.score)]
+    while len(states) <= ticks and not game.game_over:
+        direction = rng.choice(DIRECTIONS) if rng.random() < 0.2 else pilot.next_direction(game)
+        if direction is not None:
+            game.change_direction(direction)
+        game.move_snake()
+        writer.record(game)
+        states.append((list(game.snake), game.food, game.direction, game.score))
+    writer.close(game)
+    return game, states
+
+
+def test_replay_round_trips(tmp_path):
+    path = str(tmp_path / "game.snkr")
+    game, states = record_game(path)
+    assert game.score >= 50  # Several food spawns, recorded across keyframes
+    reader = ReplayReader(path)
+    try:
+        assert reader.ticks == len(states) - 1
+        assert (reader.score, reader.length, reader.game_over) == (game.score, len(game.snake), game.game_over)
+        assert [DIRECTIONS[code] for code in reader.inputs()] == [state[2] for state in states[1:]]
+        assert len(reader.offsets) == -(-reader.ticks // KEYFRAME_INTERVAL)
+    finally:
+        reader.close()
+    assert verify_replay(path)
+
+
+def test_verify_rejects_a_changed_input(tmp_path):
+    path = str(tmp_path / "game.snkr")
+    game, states = record_game(path)
+    with open(path, "rb") as f:
+        data = bytearray(f.read())
+    length = len(states[0][0])
+    inputs = HEADER.size + KEYFRAME.size + (length + 2) // 4  # First block's packed inputs
+    data[inputs] ^= 0b01  # Turns the first tick by 90 degrees
+    with open(path, "wb") as f:
+        f.write(data)
+    assert not verify_replay(path)
+
+
+def test_state_at_matches_the_live_game(tmp_path):
+    path = str(tmp_path / "game.snkr")
+    game, states = record_game(path)
+    reader = ReplayReader(path)
+    try:
+        # Start, keyframe boundaries, between keyframes and the final tick
+        for tick in (0, KEYFRAME_INTERVAL, 2 * KEYFRAME_INTERVAL, KEYFRAME_INTERVAL + 5, 3 * KEYFRAME_INTERVAL - 1,
+                     reader.ticks):
+            replayed = reader.state_at(tick)
+            assert (list(replayed.snake), replayed.food, replayed.direction, replayed.score) == states[tick]
+    finally:
+        reader.close()
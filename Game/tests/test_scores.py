@@ -0,0 +1,56 @@
+import sqlite3
+import time
+
+import pytest
+
+from snake_core.scores import ScoreStore
+
+
+def test_flush_requeues_batch_when_begin_is_locked(tmp_path):
+    path = str(tmp_path / "scores.db")
+    store = ScoreStore(path, flush_interval=3600)
+    for conn in list(store._pool.queue):
+        conn.execute("PRAGMA busy_timeout = 0")  # Fail at once instead of waiting out the lock
+    store.submit(20, 50)
+
+    blocker = sqlite3.connect(path, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        store.flush()
+    assert len(store._pending) == 1
+    assert store.best(20) == 50
+
+    blocker.execute("ROLLBACK")
+    blocker.close()
+    store.flush()
+    assert not store._pending
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT MAX(score) FROM scores WHERE grid_size = 20").fetchone()[0] == 50
+    store.close()
+
+
+def test_flusher_survives_unexpected_errors(tmp_path, monkeypatch):
+    store = ScoreStore(str(tmp_path / "scores.db"), flush_interval=0.01)
+    real_connection = store._connection
+    failures = []
+
+    def failing_connection():
+        if not failures:
+            failures.append(1)
+            raise RuntimeError("boom")
+        return real_connection()
+
+    monkeypatch.setattr(store, "_connection", failing_connection)
+    store.submit(20, 30)
+    deadline = time.monotonic() + 5
+    while not failures and time.monotonic() < deadline:
+        time.sleep(0.01)
+    store.submit(20, 40)
+    while store._pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert failures and store._flusher.is_alive()
+    assert not store._pending
+    with sqlite3.connect(store.path) as conn:
+        assert sorted(row[0] for row in conn.execute("SELECT score FROM scores")) == [30, 40]
+    store.close()
@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+from snake_core import server
+from snake_core.body import SnakeBody
+from snake_core.metrics import TickMetrics
+
+
+def test_self_collision_broadcasts_game_over(monkeypatch):
+    sent = []
+    monkeypatch.setattr(server, "broadcast", lambda subscribers, message: sent.append(json.loads(message)))
+    game_server = server.GameServer(metrics=TickMetrics(export_path=None))
+    room = server.Room("r1", 20, 200)
+    room.subscribers.add(object())
+    group = server.SpeedGroup(200, 0.0)
+    group.rooms["r1"] = room
+
+    # Head at (5, 5) heading down into its own body at (5, 6): the tick writes no cell
+    game = room.game
+    game.game_started = True
+    game.snake = SnakeBody(20, [(5, 5), (6, 5), (6, 6), (5, 6), (4, 6)])
+    game.direction = (0, 1)
+    game_server.step_group(group)
+
+    assert game.game_over
+    assert not game.board.changes
+    assert len(sent) == 1
+    assert sent[0]["game_over"] is True and sent[0]["cells"] == []
+
+    # Nothing changes on the next tick, so nothing more is sent
+    game_server.step_group(group)
+    assert len(sent) == 1
+
+
+class FakeConnection:
+    def __init__(self, messages):
+        self.messages = messages
+        self.sent = []
+
+    async def __aiter__(self):
+        for message in self.messages:
+            yield message
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+
+def test_bad_messages_get_an_error_reply_and_keep_the_connection():
+    messages = [
+        '{"type": "join", "room": "r1", "grid_size": 1e400}',  # int(inf): OverflowError
+        '{"type": "turn", "room": "r1"}',
+        'not json',
+        '{"type": "join", "room": "r1", "grid_size": 20, "speed": 200}',
+    ]
+    connection = FakeConnection(messages)
+
+    async def serve():
+        game_server = server.GameServer(metrics=TickMetrics(export_path=None))
+        await game_server.handler(connection)
+        return game_server
+
+    game_server = asyncio.run(serve())
+    assert [reply["type"] for reply in connection.sent] == ["error", "error", "error", "state"]
+    assert not game_server.rooms  # The room was closed when the connection ended
@@ -0,0 +1,23 @@
+from snake_core import SnakeGame
+from snake_core.hamiltonian import HamiltonianSolver
+
+
+def test_restored_game_stays_in_lockstep_with_original():
+    game = SnakeGame(10, seed=3)
+    game.game_started = True
+    solver = HamiltonianSolver(10)
+    while game.score < 50:
+        game.change_direction(solver.next_direction(game))
+        game.move_snake()
+
+    restored = SnakeGame.from_bytes(game.to_bytes())
+    start_score = game.score
+    while game.score < start_score + 100:  # Ten more food spawns
+        for g in (game, restored):
+            g.change_direction(solver.next_direction(g))
+            g.move_snake()
+        assert list(restored.snake) == list(game.snake)
+        assert restored.food == game.food
+        assert restored.score == game.score
+    assert restored.to_bytes() == game.to_bytes()
+    assert restored.board.cells == game.board.cells